@@ -5,31 +5,95 @@ Budgets constrain resource consumption during observation.
 Eyes must respect budgets to ensure safe, bounded extraction.
 """
 
-from __future__ import annotations
+import time
+from array import array
+from datetime import datetime
+from enum import IntEnum
+from typing import Final, Iterator, Optional
 
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from enum import Enum, auto
-from typing import Optional
+
+class BudgetType(IntEnum):
+    """
+    Types of budgets that can constrain operations.
+    
+    Values are contiguous from 0 so they double as budget array indices.
+    """
+    TIME = 0           # Wall-clock time limit
+    BYTES_READ = 1     # Total bytes read
+    FILES_SCANNED = 2  # Number of files examined
+    DEPTH = 3          # Directory/nesting depth
+    ITEMS = 4          # Number of artifacts
+    MEMORY = 5         # Memory consumption
+    API_CALLS = 6      # External API calls
+
+
+# Plain-int aliases used on hot paths instead of enum attribute lookups
+_TIME: Final[int] = 0
+_BYTES_READ: Final[int] = 1
+_FILES_SCANNED: Final[int] = 2
+_DEPTH: Final[int] = 3
+_ITEMS: Final[int] = 4
+_MEMORY: Final[int] = 5
+_API_CALLS: Final[int] = 6
+
+_BUDGET_TYPES: Final[tuple[BudgetType, ...]] = tuple(BudgetType)
+_SLOTS: Final[int] = len(_BUDGET_TYPES)
+# Summary keys, indexed by BudgetType.
+_BT_NAME_LOWER: Final[tuple[str, ...]] = tuple(
+    budget_type.name.lower() for budget_type in _BUDGET_TYPES
+)
+_INF: Final[float] = float("inf")
+_BYTES_READ_BIT: Final[int] = 1 << _BYTES_READ
+_FILES_SCANNED_BIT: Final[int] = 1 << _FILES_SCANNED
+_ITEMS_BIT: Final[int] = 1 << _ITEMS
+_API_CALLS_BIT: Final[int] = 1 << _API_CALLS
 
 
-class BudgetType(Enum):
-    """Types of budgets that can constrain operations."""
-    TIME = auto()          # Wall-clock time limit
-    BYTES_READ = auto()    # Total bytes read
-    FILES_SCANNED = auto() # Number of files examined
-    DEPTH = auto()         # Directory/nesting depth
-    ITEMS = auto()         # Number of artifacts
-    MEMORY = auto()        # Memory consumption
-    API_CALLS = auto()     # External API calls
+def _iter_mask(mask: int) -> Iterator[BudgetType]:
+    """Yield budget types for each set bit, lowest first."""
+    while mask:
+        bit = mask & -mask
+        yield _BUDGET_TYPES[bit.bit_length() - 1]
+        mask ^= bit
 
 
-@dataclass
 class BudgetLimit:
-    """A single budget constraint."""
-    budget_type: BudgetType
-    limit: float
-    consumed: float = 0.0
+    """
+    A single budget constraint.
+    
+    ``limit`` is treated as fixed after construction (its reciprocal is
+    cached for utilization).
+    """
+    
+    __slots__ = ("budget_type", "limit", "consumed", "_inv_limit")
+    
+    def __init__(
+        self,
+        budget_type: BudgetType,
+        limit: float,
+        consumed: float = 0.0,
+    ):
+        self.budget_type = budget_type
+        self.limit = limit
+        self.consumed = consumed
+        self._inv_limit = 1.0 / limit if limit else None
+    
+    def __repr__(self) -> str:
+        return (
+            f"BudgetLimit(budget_type={self.budget_type!r}, "
+            f"limit={self.limit!r}, consumed={self.consumed!r})"
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.budget_type == other.budget_type
+            and self.limit == other.limit
+            and self.consumed == other.consumed
+        )
+    
+    __hash__ = None
     
     @property
     def remaining(self) -> float:
@@ -44,9 +108,8 @@ class BudgetLimit:
     @property
     def utilization(self) -> float:
         """Fraction of budget consumed (0.0 to 1.0+)."""
-        if self.limit == 0:
-            return 1.0
-        return self.consumed / self.limit
+        inv_limit = self._inv_limit
+        return self.consumed * inv_limit if inv_limit is not None else 1.0
     
     def consume(self, amount: float) -> bool:
         """
@@ -60,17 +123,107 @@ class BudgetLimit:
         return self.consumed + amount <= self.limit
 
 
-@dataclass
 class Budget:
     """
     Collection of budget limits for an operation.
     
     Budgets are checked before each extraction step.
     When any budget is exhausted, extraction must stop.
+    
+    Limits and consumption are stored as two parallel float arrays
+    indexed by ``BudgetType``, with an int bitmap of which
+    budgets are active. Unset budgets have an infinite limit.
+    
+    A second bitmap caches which count-based budgets are exhausted. It
+    is maintained by consume(); code that writes ``_consumed`` directly
+    must clear the matching bit itself
+    (``_exhausted_mask &= ~(1 << budget_type)``).
     """
-    limits: dict[BudgetType, BudgetLimit] = field(default_factory=dict)
-    started_at: Optional[datetime] = None
-    ended_at: Optional[datetime] = None
+    
+    __slots__ = (
+        "_limit",
+        "_consumed",
+        "_mask",
+        "_exhausted_mask",
+        "_has_time",
+        "_time_limit",
+        "_time_limit_ns",
+        "_t0_ns",
+        "_t_end_ns",
+        "_wall0",
+    )
+    
+    def __init__(
+        self,
+        limits: Optional[dict[BudgetType, BudgetLimit]] = None,
+    ):
+        self._limit = array("d", [_INF]) * _SLOTS
+        self._consumed = array("d", [0.0]) * _SLOTS
+        self._mask = 0
+        self._exhausted_mask = 0
+        self._has_time = False
+        self._time_limit = _INF
+        self._time_limit_ns: int | float = _INF
+        # Elapsed time is tracked in integer nanoseconds on the monotonic
+        # performance counter; the wall-clock start is kept only to
+        # render started_at/ended_at for display.
+        self._t0_ns: Optional[int] = None
+        self._t_end_ns: Optional[int] = None
+        self._wall0: Optional[float] = None
+        
+        if limits:
+            for budget_type, limit in limits.items():
+                self._set_limit(budget_type, limit.limit, limit.consumed)
+    
+    def __repr__(self) -> str:
+        return (
+            f"Budget(limits={self.limits!r}, "
+            f"started_at={self.started_at!r}, ended_at={self.ended_at!r})"
+        )
+    
+    def _set_limit(
+        self,
+        budget_type: BudgetType,
+        limit: float,
+        consumed: float = 0.0,
+    ) -> None:
+        """Activate a budget slot."""
+        self._limit[budget_type] = limit
+        self._consumed[budget_type] = consumed
+        self._mask |= 1 << budget_type
+        if budget_type == _TIME:
+            self._has_time = True
+            self._time_limit = limit
+            self._time_limit_ns = int(limit * 1e9) if limit < _INF else _INF
+        elif consumed >= limit:
+            self._exhausted_mask |= 1 << budget_type
+    
+    @property
+    def limits(self) -> dict[BudgetType, BudgetLimit]:
+        """Active limits as BudgetLimit records (snapshot of current state)."""
+        return {
+            budget_type: BudgetLimit(
+                budget_type,
+                self._limit[budget_type],
+                self._consumed[budget_type],
+            )
+            for budget_type in _iter_mask(self._mask)
+        }
+    
+    def get_limit(self, budget_type: BudgetType) -> Optional[BudgetLimit]:
+        """
+        BudgetLimit record for one budget, or None if it is not active.
+        
+        Cheaper than ``limits.get(...)`` because only the requested
+        record is built.
+        """
+        if not self._mask >> budget_type & 1:
+            return None
+        return BudgetLimit(
+            budget_type,
+            self._limit[budget_type],
+            self._consumed[budget_type],
+        )
     
     @classmethod
     def create(
@@ -83,175 +236,318 @@ class Budget:
         items_limit: Optional[int] = None,
         memory_mb: Optional[float] = None,
         api_calls: Optional[int] = None,
-    ) -> Budget:
+    ) -> "Budget":
         """Create a budget with specified limits."""
-        limits = {}
+        budget = cls()
         
         if time_seconds is not None:
-            limits[BudgetType.TIME] = BudgetLimit(
-                BudgetType.TIME, time_seconds
-            )
+            budget._set_limit(BudgetType.TIME, time_seconds)
         if bytes_limit is not None:
-            limits[BudgetType.BYTES_READ] = BudgetLimit(
-                BudgetType.BYTES_READ, bytes_limit
-            )
+            budget._set_limit(BudgetType.BYTES_READ, bytes_limit)
         if files_limit is not None:
-            limits[BudgetType.FILES_SCANNED] = BudgetLimit(
-                BudgetType.FILES_SCANNED, files_limit
-            )
+            budget._set_limit(BudgetType.FILES_SCANNED, files_limit)
         if depth_limit is not None:
-            limits[BudgetType.DEPTH] = BudgetLimit(
-                BudgetType.DEPTH, depth_limit
-            )
+            budget._set_limit(BudgetType.DEPTH, depth_limit)
         if items_limit is not None:
-            limits[BudgetType.ITEMS] = BudgetLimit(
-                BudgetType.ITEMS, items_limit
-            )
+            budget._set_limit(BudgetType.ITEMS, items_limit)
         if memory_mb is not None:
-            limits[BudgetType.MEMORY] = BudgetLimit(
-                BudgetType.MEMORY, memory_mb
-            )
+            budget._set_limit(BudgetType.MEMORY, memory_mb)
         if api_calls is not None:
-            limits[BudgetType.API_CALLS] = BudgetLimit(
-                BudgetType.API_CALLS, api_calls
-            )
+            budget._set_limit(BudgetType.API_CALLS, api_calls)
         
-        return cls(limits=limits)
+        return budget
     
     def start(self) -> None:
         """Mark budget tracking as started."""
-        self.started_at = datetime.utcnow()
+        self._t0_ns = time.perf_counter_ns()
+        self._t_end_ns = None
+        self._wall0 = time.time()
     
     def stop(self) -> None:
         """Mark budget tracking as stopped."""
-        self.ended_at = datetime.utcnow()
+        self._t_end_ns = time.perf_counter_ns()
+    
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """When tracking started (for display)."""
+        if self._wall0 is None:
+            return None
+        return datetime.utcfromtimestamp(self._wall0)
+    
+    @property
+    def ended_at(self) -> Optional[datetime]:
+        """When tracking stopped (for display)."""
+        if self._wall0 is None or self._t_end_ns is None:
+            return None
+        elapsed = (self._t_end_ns - self._t0_ns) * 1e-9
+        return datetime.utcfromtimestamp(self._wall0 + elapsed)
     
     @property
     def elapsed_seconds(self) -> float:
         """Seconds elapsed since start."""
-        if self.started_at is None:
+        if self._t0_ns is None:
             return 0.0
-        end = self.ended_at or datetime.utcnow()
-        return (end - self.started_at).total_seconds()
+        end = self._t_end_ns
+        if end is None:
+            end = time.perf_counter_ns()
+        return (end - self._t0_ns) * 1e-9
+    
+    def _time_exhausted(self) -> bool:
+        """Whether the time budget (if any) is exhausted."""
+        if not self._has_time:
+            return False
+        if self._t0_ns is None:
+            return self._time_limit_ns <= 0
+        end = self._t_end_ns
+        if end is None:
+            end = time.perf_counter_ns()
+        return end - self._t0_ns >= self._time_limit_ns
     
     @property
     def any_exhausted(self) -> bool:
-        """Whether any budget is exhausted."""
-        # Check time budget specially
-        if BudgetType.TIME in self.limits:
-            time_limit = self.limits[BudgetType.TIME]
-            if self.elapsed_seconds >= time_limit.limit:
-                return True
+        """
+        Whether any budget is exhausted.
         
-        return any(limit.exhausted for limit in self.limits.values())
+        Count-based budgets are checked first; the clock is only read
+        when none of them is exhausted.
+        """
+        return self._exhausted_mask != 0 or self._time_exhausted()
+    
+    def iter_exhausted(self) -> Iterator[BudgetType]:
+        """Yield exhausted budget types without building a list."""
+        if self._time_exhausted():
+            yield BudgetType.TIME
+        yield from _iter_mask(self._exhausted_mask)
     
     @property
     def exhausted_budgets(self) -> list[BudgetType]:
         """List of exhausted budget types."""
-        exhausted = []
-        
-        if BudgetType.TIME in self.limits:
-            time_limit = self.limits[BudgetType.TIME]
-            if self.elapsed_seconds >= time_limit.limit:
-                exhausted.append(BudgetType.TIME)
-        
-        for budget_type, limit in self.limits.items():
-            if budget_type != BudgetType.TIME and limit.exhausted:
-                exhausted.append(budget_type)
-        
-        return exhausted
+        return list(self.iter_exhausted())
     
     def consume(self, budget_type: BudgetType, amount: float) -> bool:
         """
         Consume from a specific budget.
-        Returns True if within limits.
+        Returns True if within limits (always True if no limit set).
+        """
+        consumed = self._consumed
+        consumed[budget_type] += amount
+        if consumed[budget_type] >= self._limit[budget_type]:
+            if budget_type != _TIME:
+                self._exhausted_mask |= 1 << budget_type
+            return consumed[budget_type] <= self._limit[budget_type]
+        if amount < 0:
+            self._exhausted_mask &= ~(1 << budget_type)
+        return True
+    
+    def consume_items_fast(self, count: int = 1) -> bool:
+        """
+        consume(BudgetType.ITEMS, count) specialized for positive counts.
+        """
+        consumed = self._consumed
+        items = consumed[_ITEMS] + count
+        consumed[_ITEMS] = items
+        items_limit = self._limit[_ITEMS]
+        if items >= items_limit:
+            self._exhausted_mask |= _ITEMS_BIT
+            return items <= items_limit
+        return True
+    
+    def consume_api_fast(self, count: int = 1) -> bool:
         """
-        if budget_type not in self.limits:
-            return True  # No limit set
-        return self.limits[budget_type].consume(amount)
+        consume(BudgetType.API_CALLS, count) specialized for positive counts.
+        """
+        consumed = self._consumed
+        calls = consumed[_API_CALLS] + count
+        consumed[_API_CALLS] = calls
+        calls_limit = self._limit[_API_CALLS]
+        if calls >= calls_limit:
+            self._exhausted_mask |= _API_CALLS_BIT
+            return calls <= calls_limit
+        return True
+    
+    def consume_file(self, size_bytes: int = 0) -> bool:
+        """
+        Consume one file and its bytes in a single call.
+        Returns True if both the file and byte budgets are within limits.
+        """
+        consumed = self._consumed
+        limit = self._limit
+        files = consumed[_FILES_SCANNED] + 1
+        bytes_read = consumed[_BYTES_READ] + size_bytes
+        consumed[_FILES_SCANNED] = files
+        consumed[_BYTES_READ] = bytes_read
+        
+        files_limit = limit[_FILES_SCANNED]
+        bytes_limit = limit[_BYTES_READ]
+        if files >= files_limit or bytes_read >= bytes_limit:
+            if files >= files_limit:
+                self._exhausted_mask |= _FILES_SCANNED_BIT
+            if bytes_read >= bytes_limit:
+                self._exhausted_mask |= _BYTES_READ_BIT
+            return files <= files_limit and bytes_read <= bytes_limit
+        return True
+    
+    def consume_batch(
+        self,
+        *,
+        files: int = 0,
+        bytes_: int = 0,
+        items: int = 0,
+    ) -> bool:
+        """
+        Consume files, bytes and items in a single call.
+        
+        For sources that discover many entries at once (e.g. a directory
+        listing). Amounts must be non-negative. Returns True if all three
+        budgets stay within limits.
+        """
+        consumed = self._consumed
+        limit = self._limit
+        consumed[_FILES_SCANNED] += files
+        consumed[_BYTES_READ] += bytes_
+        consumed[_ITEMS] += items
+        
+        exhausted = 0
+        if consumed[_FILES_SCANNED] >= limit[_FILES_SCANNED]:
+            exhausted |= _FILES_SCANNED_BIT
+        if consumed[_BYTES_READ] >= limit[_BYTES_READ]:
+            exhausted |= _BYTES_READ_BIT
+        if consumed[_ITEMS] >= limit[_ITEMS]:
+            exhausted |= _ITEMS_BIT
+        if not exhausted:
+            return True
+        
+        self._exhausted_mask |= exhausted
+        return (
+            consumed[_FILES_SCANNED] <= limit[_FILES_SCANNED]
+            and consumed[_BYTES_READ] <= limit[_BYTES_READ]
+            and consumed[_ITEMS] <= limit[_ITEMS]
+        )
     
     def can_consume(self, budget_type: BudgetType, amount: float) -> bool:
         """Check if consumption would be within limits."""
-        if budget_type not in self.limits:
-            return True
-        return self.limits[budget_type].can_consume(amount)
+        return self._consumed[budget_type] + amount <= self._limit[budget_type]
     
     def remaining(self, budget_type: BudgetType) -> Optional[float]:
         """Get remaining budget for a type, None if unlimited."""
-        if budget_type == BudgetType.TIME:
-            if BudgetType.TIME in self.limits:
-                return self.limits[BudgetType.TIME].limit - self.elapsed_seconds
+        if not self._mask & (1 << budget_type):
             return None
         
-        if budget_type not in self.limits:
-            return None
-        return self.limits[budget_type].remaining
+        if budget_type == _TIME:
+            return self._time_limit - self.elapsed_seconds
+        
+        return max(0.0, self._limit[budget_type] - self._consumed[budget_type])
+    
+    def summary_arrays(self) -> tuple[array, array, array, array]:
+        """
+        Get (limit, consumed, remaining, utilization) as raw float arrays.
+        
+        Arrays are indexed by BudgetType. Unset budgets have an infinite
+        limit and remaining, and zero utilization. Intended for numeric
+        consumers (monitoring, alarms) that do not need summary()'s dicts.
+        """
+        limit = self._limit[:]
+        consumed = self._consumed[:]
+        if self._has_time:
+            consumed[_TIME] = self.elapsed_seconds
+        
+        pairs = list(zip(limit, consumed))
+        remaining = array("d", [max(0.0, lim - used) for lim, used in pairs])
+        utilization = array(
+            "d", [used / lim if lim > 0 else 1.0 for lim, used in pairs]
+        )
+        return limit, consumed, remaining, utilization
     
     def summary(self) -> dict[str, dict[str, float]]:
         """Get summary of all budgets."""
-        result = {}
+        limit, consumed, remaining, utilization = self.summary_arrays()
         
-        for budget_type, limit in self.limits.items():
-            consumed = limit.consumed
-            if budget_type == BudgetType.TIME:
-                consumed = self.elapsed_seconds
-            
-            result[budget_type.name.lower()] = {
-                "limit": limit.limit,
-                "consumed": consumed,
-                "remaining": max(0.0, limit.limit - consumed),
-                "utilization": consumed / limit.limit if limit.limit > 0 else 1.0,
+        return {
+            _BT_NAME_LOWER[budget_type]: {
+                "limit": limit[budget_type],
+                "consumed": consumed[budget_type],
+                "remaining": remaining[budget_type],
+                "utilization": utilization[budget_type],
             }
-        
-        return result
+            for budget_type in _iter_mask(self._mask)
+        }
 
 
 # -----------------------------------------------------------------------------
 # Budget Presets
 # -----------------------------------------------------------------------------
 
+# Preset templates are built once at import and copied per call.
+# Nothing may ever consume from them.
+_QUICK_SCAN = Budget.create(
+    time_seconds=30,
+    files_limit=100,
+    bytes_limit=10 * 1024 * 1024,  # 10 MB
+    depth_limit=3,
+)
+_STANDARD = Budget.create(
+    time_seconds=300,  # 5 minutes
+    files_limit=1000,
+    bytes_limit=100 * 1024 * 1024,  # 100 MB
+    depth_limit=10,
+)
+_DEEP_ANALYSIS = Budget.create(
+    time_seconds=3600,  # 1 hour
+    files_limit=10000,
+    bytes_limit=1024 * 1024 * 1024,  # 1 GB
+    depth_limit=20,
+)
+_METADATA_ONLY = Budget.create(
+    time_seconds=60,
+    files_limit=500,
+    bytes_limit=1024 * 1024,  # 1 MB
+    depth_limit=5,
+)
+
+
+def _from_template(template: Budget) -> Budget:
+    """
+    Fresh, unstarted budget with the template's limits.
+    
+    Bypasses Budget.__init__ and sets every slot directly, so the limit
+    array is copied once rather than allocated and then overwritten.
+    """
+    budget = Budget.__new__(Budget)
+    budget._limit = template._limit[:]
+    budget._consumed = template._consumed[:]  # all zero: never consumed
+    budget._mask = template._mask
+    budget._exhausted_mask = template._exhausted_mask
+    budget._has_time = template._has_time
+    budget._time_limit = template._time_limit
+    budget._time_limit_ns = template._time_limit_ns
+    budget._t0_ns = None
+    budget._t_end_ns = None
+    budget._wall0 = None
+    return budget
+
+
 class BudgetPresets:
     """Common budget configurations."""
     
     @staticmethod
     def quick_scan() -> Budget:
         """Fast, shallow scan for discovery."""
-        return Budget.create(
-            time_seconds=30,
-            files_limit=100,
-            bytes_limit=10 * 1024 * 1024,  # 10 MB
-            depth_limit=3,
-        )
+        return _from_template(_QUICK_SCAN)
     
     @staticmethod
     def standard() -> Budget:
         """Standard extraction budget."""
-        return Budget.create(
-            time_seconds=300,  # 5 minutes
-            files_limit=1000,
-            bytes_limit=100 * 1024 * 1024,  # 100 MB
-            depth_limit=10,
-        )
+        return _from_template(_STANDARD)
     
     @staticmethod
     def deep_analysis() -> Budget:
         """Thorough analysis with generous limits."""
-        return Budget.create(
-            time_seconds=3600,  # 1 hour
-            files_limit=10000,
-            bytes_limit=1024 * 1024 * 1024,  # 1 GB
-            depth_limit=20,
-        )
+        return _from_template(_DEEP_ANALYSIS)
     
     @staticmethod
     def metadata_only() -> Budget:
         """Minimal budget for metadata-only scans."""
-        return Budget.create(
-            time_seconds=60,
-            files_limit=500,
-            bytes_limit=1024 * 1024,  # 1 MB
-            depth_limit=5,
-        )
+        return _from_template(_METADATA_ONLY)
     
     @staticmethod
     def unlimited() -> Budget:
@@ -275,14 +571,20 @@ class BudgetGuard:
                     break
                 guard.consume_file()
                 process(file)
+    
+    can_continue() only reads the clock on every 64th call; the other
+    calls check count-based budgets alone. A time limit may therefore be
+    overrun by up to 63 loop iterations.
     """
     
+    __slots__ = ("budget", "_tick", "_tick_mask")
+    
     def __init__(self, budget: Budget):
         self.budget = budget
-        self._files_processed = 0
-        self._bytes_processed = 0
+        self._tick = 0
+        self._tick_mask = 63
     
-    def __enter__(self) -> BudgetGuard:
+    def __enter__(self) -> "BudgetGuard":
         self.budget.start()
         return self
     
@@ -291,38 +593,48 @@ class BudgetGuard:
     
     def can_continue(self) -> bool:
         """Check if operation should continue."""
+        tick = self._tick + 1
+        self._tick = tick
+        if tick & self._tick_mask:
+            return not self.budget._exhausted_mask
         return not self.budget.any_exhausted
     
+    def can_consume(self, budget_type: BudgetType, amount: float = 1) -> bool:
+        """Check if amount can be consumed without exceeding budget."""
+        return self.budget.can_consume(budget_type, amount)
+    
     def consume_file(self, size_bytes: int = 0) -> bool:
         """Record file processing. Returns True if within budget."""
-        self._files_processed += 1
-        self._bytes_processed += size_bytes
-        
-        within_files = self.budget.consume(BudgetType.FILES_SCANNED, 1)
-        within_bytes = self.budget.consume(BudgetType.BYTES_READ, size_bytes)
-        
-        return within_files and within_bytes
+        return self.budget.consume_file(size_bytes)
+    
+    def consume_batch(
+        self,
+        *,
+        files: int = 0,
+        bytes_: int = 0,
+        items: int = 0,
+    ) -> bool:
+        """Record a batch of files/bytes/items. Returns True if within budget."""
+        return self.budget.consume_batch(files=files, bytes_=bytes_, items=items)
     
     def consume_item(self) -> bool:
         """Record item creation. Returns True if within budget."""
-        return self.budget.consume(BudgetType.ITEMS, 1)
+        return self.budget.consume_items_fast()
     
     def consume_api_call(self) -> bool:
         """Record API call. Returns True if within budget."""
-        return self.budget.consume(BudgetType.API_CALLS, 1)
+        return self.budget.consume_api_fast()
     
     def at_depth(self, depth: int) -> bool:
         """Check if depth is within budget."""
-        limit = self.budget.limits.get(BudgetType.DEPTH)
-        if limit is None:
-            return True
-        return depth <= limit.limit
+        return depth <= self.budget._limit[_DEPTH]
     
     @property
     def summary(self) -> dict:
         """Get current budget summary."""
+        exhausted = self.budget.exhausted_budgets
         return {
-            "exhausted": self.budget.any_exhausted,
-            "exhausted_types": [t.name for t in self.budget.exhausted_budgets],
+            "exhausted": bool(exhausted),
+            "exhausted_types": [t.name for t in exhausted],
             "budgets": self.budget.summary(),
         }
@@ -6,10 +6,74 @@ No hidden state. Deterministic behavior. Clear logging.
 """
 
 import argparse
+import functools
+import os
+import stat
 import sys
 import time
-import uuid
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+from atlas.ids import next_id
+
+# Actor shared by every event the CLI emits itself
+_CLI_ACTOR = {"module": "CLI"}
+
+# Report templates
+_SCAN_REPORT = (
+    "[atlas] Scan complete:\n"
+    "        Files observed: %d\n"
+    "        Bytes accounted: %d\n"
+    "        Duration: %.0fms\n"
+)
+_STOPPED_LINE = "        Stopped: %s\n"
+_REMOTE_REPORT = (
+    "[atlas] Remote scan complete:\n"
+    "        URLs attempted: %d\n"
+    "        URLs successful: %d\n"
+    "        Remote calls: %d\n"
+    "        Duration: %.0fms\n"
+)
+_URL_OK_LINE = "        ✓ %s...\n"
+_URL_FAILED_LINE = "        ✗ %s... (%s: %s)\n"
+
+
+def _session_event(
+    event_type: str,
+    ts: float,
+    session_id: str,
+    payload: dict,
+) -> dict:
+    """Build a SESSION_STARTED/SESSION_ENDED event emitted by the CLI."""
+    return {
+        "event_id": next_id("sess"),
+        "event_type": event_type,
+        "ts": ts,
+        "actor": _CLI_ACTOR,
+        "artifact_id": None,
+        "confidence": 1.0,
+        "evidence_refs": [],
+        "session_id": session_id,
+        "payload": payload,
+    }
+
+
+@dataclass(slots=True)
+class ScanBudget:
+    """Budget limits for scan, read as plain attributes by FilesystemEye."""
+    max_time_ms: Optional[float]
+    max_files: int
+    max_bytes: int
+    max_depth: int
+
+
+@dataclass(slots=True)
+class RemoteBudget:
+    """Budget limits for remote-scan, read by WebEye and RemoteRepoEye."""
+    max_time_ms: float
+    max_bytes: int
+    max_bytes_per_artifact: int
 
 
 def get_ledger_dir() -> Path:
@@ -22,6 +86,22 @@ def get_state_dir() -> Path:
     return Path("atlas/state")
 
 
+def get_writer(args):
+    """
+    Get the EventWriter for a command.
+
+    Uses the writer shared by ``atlas serve`` when one is attached to
+    args, otherwise opens one for the ledger directory.
+    """
+    writer = getattr(args, "writer", None)
+    if writer is None:
+        from atlas.ledger.writer import EventWriter
+
+        ledger_dir = args.ledger_dir or get_ledger_dir()
+        writer = EventWriter(ledger_dir=str(ledger_dir))
+    return writer
+
+
 def cmd_export(args) -> int:
     """
     Export current Atlas state.
@@ -60,56 +140,46 @@ def cmd_scan(args) -> int:
     Creates a session, runs FilesystemEye, writes events.
     """
     from atlas.eyes.filesystem import FilesystemEye
-    from atlas.ledger.writer import EventWriter
 
     # Enforce --no-remote (backbone mode)
     if getattr(args, 'no_remote', False):
         pass  # Already local-only for scan; flag is declarative
 
-    target = Path(args.path).resolve()
-
-    if not target.exists():
-        print(f"ERROR: Path does not exist: {target}", file=sys.stderr)
+    # One stat for both checks; resolve symlinks only once it exists
+    try:
+        st = os.stat(args.path)
+    except OSError:
+        print(f"ERROR: Path does not exist: {os.path.abspath(args.path)}",
+              file=sys.stderr)
         return 1
 
-    if not target.is_dir():
+    # Kept as str: it only feeds messages, the payload and the eye
+    target = os.path.realpath(args.path)
+
+    if not stat.S_ISDIR(st.st_mode):
         print(f"ERROR: Path is not a directory: {target}", file=sys.stderr)
         return 1
 
     # Create session
-    session_id = f"session-{uuid.uuid4().hex[:12]}"
+    session_id = next_id("session")
     start_time = time.time()
 
     print(f"[atlas] Starting scan session: {session_id}")
     print(f"[atlas] Target: {target}")
 
     # Initialize components
-    ledger_dir = args.ledger_dir or get_ledger_dir()
-    writer = EventWriter(ledger_dir=str(ledger_dir))
+    writer = get_writer(args)
 
     # Emit session start event
-    writer.append({
-        "event_id": f"sess-{uuid.uuid4().hex[:12]}",
-        "event_type": "SESSION_STARTED",
-        "ts": start_time,
-        "actor": {"module": "CLI"},
-        "artifact_id": None,
-        "confidence": 1.0,
-        "evidence_refs": [],
-        "session_id": session_id,
-        "payload": {
-            "target": str(target),
+    writer.append(_session_event(
+        "SESSION_STARTED",
+        start_time,
+        session_id,
+        {
+            "target": target,
             "command": "scan",
         },
-    })
-
-    # FilesystemEye expects direct attributes, so create a simple object
-    class SimpleBudget:
-        def __init__(self, max_time_ms, max_files, max_bytes, max_depth):
-            self.max_time_ms = max_time_ms
-            self.max_files = max_files
-            self.max_bytes = max_bytes
-            self.max_depth = max_depth
+    ))
 
     # Resolve time budget: --max-time-ms takes priority, then --max-time (seconds)
     max_time_ms = None
@@ -118,7 +188,7 @@ def cmd_scan(args) -> int:
     elif args.max_time is not None:
         max_time_ms = args.max_time * 1000
 
-    budget = SimpleBudget(
+    budget = ScanBudget(
         max_time_ms=max_time_ms,
         max_files=args.max_files,
         max_bytes=args.max_bytes,
@@ -133,41 +203,41 @@ def cmd_scan(args) -> int:
     if salience_mode:
         print(f"[atlas] Salience: {salience_mode}")
 
-    # Run filesystem eye
+    # Run filesystem eye; its events and the session end share fsyncs
     eye = FilesystemEye(writer)
-    result = eye.observe(
-        root=str(target),
-        budget=budget,
-        session_id=session_id,
-    )
-
-    # Emit session end event
-    end_time = time.time()
-    writer.append({
-        "event_id": f"sess-{uuid.uuid4().hex[:12]}",
-        "event_type": "SESSION_ENDED",
-        "ts": end_time,
-        "actor": {"module": "CLI"},
-        "artifact_id": None,
-        "confidence": 1.0,
-        "evidence_refs": [],
-        "session_id": session_id,
-        "payload": {
-            "duration_ms": (end_time - start_time) * 1000,
-            "files_seen": result["files_seen"],
-            "bytes_accounted": result["bytes_accounted"],
-            "stopped_reason": result.get("stopped_reason"),
-        },
-    })
+    with writer.commit_group():
+        result = eye.observe(
+            root=target,
+            budget=budget,
+            session_id=session_id,
+            workers=args.workers,
+        )
 
-    # Report results
-    print(f"[atlas] Scan complete:")
-    print(f"        Files observed: {result['files_seen']}")
-    print(f"        Bytes accounted: {result['bytes_accounted']}")
-    print(f"        Duration: {(end_time - start_time) * 1000:.0f}ms")
+        # Emit session end event
+        end_time = time.time()
+        writer.append(_session_event(
+            "SESSION_ENDED",
+            end_time,
+            session_id,
+            {
+                "duration_ms": (end_time - start_time) * 1000,
+                "files_seen": result["files_seen"],
+                "bytes_accounted": result["bytes_accounted"],
+                "stopped_reason": result.get("stopped_reason"),
+            },
+        ))
+
+    # Report results (one write for the whole report)
+    report = _SCAN_REPORT % (
+        result["files_seen"],
+        result["bytes_accounted"],
+        (end_time - start_time) * 1000,
+    )
 
     if result.get("stopped_reason"):
-        print(f"        Stopped: {result['stopped_reason']}")
+        report += _STOPPED_LINE % result["stopped_reason"]
+
+    sys.stdout.write(report)
 
     return 0
 
@@ -176,7 +246,8 @@ def cmd_rebuild(args) -> int:
     """
     Rebuild state from ledger.
 
-    Replays all events and rebuilds snapshots.
+    Replays all events and rebuilds snapshots. Skipped when the
+    snapshot is newer than every ledger file, unless --force is given.
     """
     from atlas.ledger.reader import EventReader
     from atlas.ledger.reducers import project_artifacts
@@ -184,27 +255,47 @@ def cmd_rebuild(args) -> int:
 
     print("[atlas] Starting rebuild")
 
-    # Initialize reader
     ledger_dir = args.ledger_dir or get_ledger_dir()
+    state_dir = args.state_dir or get_state_dir()
+    snap_path = snapshot_path(state_dir)
+
+    # Nothing appended since the last snapshot: skip the replay
+    if not getattr(args, "force", False):
+        try:
+            snap_mtime = os.stat(snap_path).st_mtime_ns
+        except OSError:
+            snap_mtime = None
+        if snap_mtime is not None:
+            ledger_mtimes = [
+                p.stat().st_mtime_ns for p in Path(ledger_dir).glob("*.jsonl")
+            ]
+            if ledger_mtimes and max(ledger_mtimes) < snap_mtime:
+                print("[atlas] Snapshot up-to-date (use --force to rebuild)")
+                return 0
+
+    # Initialize reader
     reader = EventReader(ledger_dir=str(ledger_dir))
 
-    # Count events
-    events = list(reader.read_all())
-    print(f"[atlas] Found {len(events)} events in ledger")
+    # Stream events into the projection, counting as they pass
+    event_count = 0
+
+    def counted_events():
+        nonlocal event_count
+        for event in reader.read_all():
+            event_count += 1
+            yield event
+
+    print("[atlas] Projecting artifact state...")
+    artifacts = project_artifacts(counted_events())
+    print(f"[atlas] Found {event_count} events in ledger")
 
-    if not events:
+    if not event_count:
         print("[atlas] No events to process")
         return 0
 
-    # Project artifacts
-    print("[atlas] Projecting artifact state...")
-    artifacts = project_artifacts(events)
     print(f"[atlas] Projected {len(artifacts)} artifacts")
 
     # Write snapshot
-    state_dir = args.state_dir or get_state_dir()
-    snap_path = snapshot_path(state_dir)
-
     print(f"[atlas] Writing snapshot to {snap_path}")
     count = write_snapshot(snap_path, artifacts)
     print(f"[atlas] Wrote {count} artifacts to snapshot")
@@ -217,47 +308,46 @@ def cmd_remote_scan(args) -> int:
     """
     Scan a remote URL and emit observation events.
 
-    Requires explicit --allow-remote flag.
+    Requires explicit --allow-remote flag. Per-URL results are printed
+    for humans on a terminal and as JSON lines when stdout is piped;
+    when piped, progress and the report go to stderr so stdout stays
+    valid JSONL.
     """
     from atlas.eyes.web import WebEye
     from atlas.eyes.remote_repo import RemoteRepoEye
-    from atlas.ledger.writer import EventWriter
     from atlas.remote.policy import RemotePolicy
 
     url = args.url
+    interactive = sys.stdout.isatty()
+    # Human-readable progress; kept off stdout when it carries JSON
+    log = sys.stdout if interactive else sys.stderr
 
     # Remote access is OFF by default
     if not args.allow_remote:
-        print("[atlas] ERROR: Remote access disabled by default")
-        print("[atlas] Use --allow-remote to enable")
+        print("[atlas] ERROR: Remote access disabled by default", file=log)
+        print("[atlas] Use --allow-remote to enable", file=log)
         return 1
 
     # Create session
-    session_id = f"session-{uuid.uuid4().hex[:12]}"
+    session_id = next_id("session")
     start_time = time.time()
 
-    print(f"[atlas] Starting remote scan session: {session_id}")
-    print(f"[atlas] Target: {url}")
+    print(f"[atlas] Starting remote scan session: {session_id}", file=log)
+    print(f"[atlas] Target: {url}", file=log)
 
     # Initialize writer
-    ledger_dir = args.ledger_dir or get_ledger_dir()
-    writer = EventWriter(ledger_dir=str(ledger_dir))
+    writer = get_writer(args)
 
     # Emit session start
-    writer.append({
-        "event_id": f"sess-{uuid.uuid4().hex[:12]}",
-        "event_type": "SESSION_STARTED",
-        "ts": start_time,
-        "actor": {"module": "CLI"},
-        "artifact_id": None,
-        "confidence": 1.0,
-        "evidence_refs": [],
-        "session_id": session_id,
-        "payload": {
+    writer.append(_session_event(
+        "SESSION_STARTED",
+        start_time,
+        session_id,
+        {
             "target": url,
             "command": "remote-scan",
         },
-    })
+    ))
 
     # Create policy
     domains = args.domains.split(",") if args.domains else None
@@ -269,25 +359,20 @@ def cmd_remote_scan(args) -> int:
     )
 
     print(f"[atlas] Policy: max_calls={policy.max_remote_calls}, "
-          f"freshness={policy.freshness_window_seconds}s")
+          f"freshness={policy.freshness_window_seconds}s", file=log)
 
     # Create budget
-    class SimpleBudget:
-        def __init__(self, max_time_ms, max_bytes):
-            self.max_time_ms = max_time_ms
-            self.max_bytes = max_bytes
-            self.max_bytes_per_artifact = max_bytes
-
-    budget = SimpleBudget(
+    budget = RemoteBudget(
         max_time_ms=args.max_time * 1000 if args.max_time else 60000,
         max_bytes=args.max_bytes,
+        max_bytes_per_artifact=args.max_bytes,
     )
 
     # Choose eye based on URL
     results = []
 
     if "github.com" in url or url.startswith("git+"):
-        print("[atlas] Using RemoteRepoEye")
+        print("[atlas] Using RemoteRepoEye", file=log)
         eye = RemoteRepoEye(writer)
         results = eye.observe_repo(
             repo_url=url,
@@ -296,7 +381,7 @@ def cmd_remote_scan(args) -> int:
             session_id=session_id,
         )
     else:
-        print("[atlas] Using WebEye")
+        print("[atlas] Using WebEye", file=log)
         eye = WebEye(writer)
         result = eye.observe(
             url=url,
@@ -308,41 +393,49 @@ def cmd_remote_scan(args) -> int:
 
     # Emit session end
     end_time = time.time()
-    successful = sum(1 for r in results if r.get("status") == "success")
-
-    writer.append({
-        "event_id": f"sess-{uuid.uuid4().hex[:12]}",
-        "event_type": "SESSION_ENDED",
-        "ts": end_time,
-        "actor": {"module": "CLI"},
-        "artifact_id": None,
-        "confidence": 1.0,
-        "evidence_refs": [],
-        "session_id": session_id,
-        "payload": {
+    # One pass over results; statuses are reused by the report
+    statuses = [r.get("status", "unknown") for r in results]
+    successful = statuses.count("success")
+
+    writer.append(_session_event(
+        "SESSION_ENDED",
+        end_time,
+        session_id,
+        {
             "duration_ms": (end_time - start_time) * 1000,
             "urls_attempted": len(results),
             "urls_successful": successful,
             "remote_calls_made": policy.calls_made,
         },
-    })
-
-    # Report
-    print("[atlas] Remote scan complete:")
-    print(f"        URLs attempted: {len(results)}")
-    print(f"        URLs successful: {successful}")
-    print(f"        Remote calls: {policy.calls_made}")
-    print(f"        Duration: {(end_time - start_time) * 1000:.0f}ms")
-
-    for r in results:
-        status = r.get("status", "unknown")
-        if status == "success":
-            print(f"        ✓ {r['url'][:60]}...")
-        elif status == "not_found":
-            pass  # Skip 404s silently
-        else:
-            reason = r.get("reason", "")
-            print(f"        ✗ {r['url'][:40]}... ({status}: {reason})")
+    ))
+
+    # Report (one write for the whole report)
+    report = _REMOTE_REPORT % (
+        len(results),
+        successful,
+        policy.calls_made,
+        (end_time - start_time) * 1000,
+    )
+
+    if interactive:
+        lines = [report]
+        for r, status in zip(results, statuses):
+            if status == "success":
+                lines.append(_URL_OK_LINE % r["url"][:60])
+            elif status == "not_found":
+                pass  # Skip 404s silently
+            else:
+                reason = r.get("reason", "")
+                lines.append(_URL_FAILED_LINE % (r["url"][:40], status, reason))
+    else:
+        # Piped: one full JSON result per line for downstream tools
+        import json
+
+        log.write(report)
+        encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        lines = [encode(r) + "\n" for r in results]
+
+    sys.stdout.write("".join(lines))
 
     return 0
 
@@ -351,33 +444,31 @@ def cmd_janitor(args) -> int:
     """
     Analyze system state and print maintenance recommendations.
     """
-    from atlas.ledger.writer import EventWriter
     from atlas.maintenance.janitor import Janitor
-    from atlas.state.snapshots import read_snapshot, snapshot_path
+    from atlas.state.snapshots import get_snapshot, snapshot_path
 
     print("[atlas] Running janitor analysis")
 
     # Load snapshot
     state_dir = args.state_dir or get_state_dir()
     snap_path = snapshot_path(state_dir)
+    artifacts = get_snapshot(snap_path)
 
-    if not snap_path.exists():
+    if artifacts is None:
         print("[atlas] No snapshot found. Run 'atlas rebuild' first.")
         return 1
 
-    artifacts = read_snapshot(snap_path)
     print(f"[atlas] Loaded {len(artifacts)} artifacts from snapshot")
 
     # Initialize janitor with writer
-    ledger_dir = args.ledger_dir or get_ledger_dir()
-    writer = EventWriter(ledger_dir=str(ledger_dir))
+    writer = get_writer(args)
     janitor = Janitor(writer=writer)
 
     # Create session
-    session_id = f"session-{uuid.uuid4().hex[:12]}"
+    session_id = next_id("session")
 
     # Run analysis
-    cache_dir = "atlas/cache" if Path("atlas/cache").exists() else None
+    cache_dir = "atlas/cache" if os.path.isdir("atlas/cache") else None
     recommendations = janitor.run(
         artifacts=artifacts,
         cache_dir=cache_dir,
@@ -400,20 +491,17 @@ def cmd_archive(args) -> int:
 
     Does nothing without --apply flag.
     """
-    from atlas.ledger.writer import EventWriter
     from atlas.maintenance.archive import Archive
     from atlas.maintenance.janitor import Janitor
-    from atlas.state.snapshots import read_snapshot, snapshot_path
 
     cache_dir = Path("atlas/cache")
 
-    if not cache_dir.exists():
+    if not os.path.isdir(cache_dir):
         print("[atlas] No cache directory found")
         return 0
 
     # Initialize
-    ledger_dir = args.ledger_dir or get_ledger_dir()
-    writer = EventWriter(ledger_dir=str(ledger_dir))
+    writer = get_writer(args)
 
     archive = Archive(
         cache_dir=str(cache_dir),
@@ -426,16 +514,16 @@ def cmd_archive(args) -> int:
     print(f"        Files: {stats['total_files']}")
     print(f"        Size: {stats['total_bytes']} bytes")
 
+    # Get files to archive (one cache analysis for either mode)
+    janitor = Janitor()
+    cache_recs = janitor.analyze_cache(
+        cache_dir=str(cache_dir),
+        max_age_days=args.max_age_days,
+    )
+
     if not args.apply:
         print("[atlas] Dry run mode (use --apply to execute)")
 
-        # Get recommendations
-        janitor = Janitor()
-        cache_recs = janitor.analyze_cache(
-            cache_dir=str(cache_dir),
-            max_age_days=args.max_age_days,
-        )
-
         if cache_recs:
             print(f"[atlas] Would archive {len(cache_recs)} files:")
             for rec in cache_recs[:5]:
@@ -450,21 +538,18 @@ def cmd_archive(args) -> int:
     # Apply mode - actually archive
     print("[atlas] Applying archive...")
 
-    session_id = f"session-{uuid.uuid4().hex[:12]}"
-
-    # Get files to archive
-    janitor = Janitor()
-    cache_recs = janitor.analyze_cache(
-        cache_dir=str(cache_dir),
-        max_age_days=args.max_age_days,
-    )
-
     if not cache_recs:
         print("[atlas] No files to archive")
         return 0
 
-    paths = [rec.path for rec in cache_recs]
-    results = archive.archive_batch(paths, session_id=session_id)
+    session_id = next_id("session")
+
+    with writer.commit_group():
+        results = archive.archive_batch(
+            (rec.path for rec in cache_recs),
+            session_id=session_id,
+            workers=args.workers,
+        )
 
     successful = sum(1 for r in results if r.success)
     failed = len(results) - successful
@@ -509,6 +594,83 @@ def cmd_index_rebuild(args) -> int:
     return 0
 
 
+def cmd_serve(args) -> int:
+    """
+    Run CLI commands read from stdin, one per line.
+
+    Each line is a JSON array of command arguments, e.g.
+    ["scan", "src", "--max-files", "100"]. Global --ledger-dir and
+    --state-dir come from the serve invocation. One EventWriter is
+    opened up front and shared by every command. After each command a
+    JSON result line with its exit code is written to stdout; while
+    serving, the commands' own output goes to stderr so stdout carries
+    only result lines.
+    """
+    import json
+    from contextlib import redirect_stdout
+
+    writer = get_writer(args)
+    out = sys.stdout
+
+    def respond(result: dict) -> None:
+        print(json.dumps(result), file=out, flush=True)
+
+    global_argv = []
+    if args.ledger_dir:
+        global_argv += ["--ledger-dir", args.ledger_dir]
+    if args.state_dir:
+        global_argv += ["--state-dir", args.state_dir]
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        try:
+            argv = json.loads(line)
+        except json.JSONDecodeError as e:
+            respond({"error": f"Invalid JSON: {e}"})
+            continue
+
+        if not isinstance(argv, list) or not all(
+            isinstance(arg, str) for arg in argv
+        ):
+            respond({"error": "Expected a JSON array of strings"})
+            continue
+
+        command = _peek_command(argv)
+        if command == "serve":
+            respond({"command": command, "error": "Nested serve"})
+            continue
+
+        argv = global_argv + argv
+        try:
+            # --help and usage text must not land on stdout either
+            with redirect_stdout(sys.stderr):
+                cmd_args = _build_parser(
+                    command if command in _COMMAND_PARSERS else None
+                ).parse_args(argv)
+        except SystemExit as e:
+            respond({"command": command, "exit_code": e.code})
+            continue
+
+        # Share the writer unless the line picked another ledger
+        if cmd_args.ledger_dir == args.ledger_dir:
+            cmd_args.writer = writer
+        try:
+            with redirect_stdout(sys.stderr):
+                code = cmd_args.func(cmd_args)
+        except SystemExit as e:
+            respond({"command": command, "exit_code": e.code})
+            continue
+        except Exception as e:
+            respond({"command": command, "error": str(e)})
+            continue
+
+        respond({"command": command, "exit_code": code})
+
+    return 0
+
+
 def cmd_version(args) -> int:
     """Print version information."""
     from atlas import __version__
@@ -517,28 +679,8 @@ def cmd_version(args) -> int:
     return 0
 
 
-def main(argv=None) -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="atlas",
-        description="Atlas Core - Universal observation ledger",
-    )
-
-    parser.add_argument(
-        "--ledger-dir",
-        type=str,
-        help="Ledger directory (default: atlas/ledger/events)",
-    )
-
-    parser.add_argument(
-        "--state-dir",
-        type=str,
-        help="State directory (default: atlas/state)",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # scan command
+def _add_scan_parser(subparsers) -> None:
+    """Register the scan command."""
     scan_parser = subparsers.add_parser(
         "scan",
         help="Scan a directory and emit observation events",
@@ -589,16 +731,31 @@ def main(argv=None) -> int:
         default="log-only",
         help="Salience mode: log-only, active, disabled (default: log-only)",
     )
+    scan_parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(16, (os.cpu_count() or 1) * 2),
+        help="Threads used to hash files (default: 2 per CPU, max 16)",
+    )
     scan_parser.set_defaults(func=cmd_scan)
 
-    # rebuild command
+
+def _add_rebuild_parser(subparsers) -> None:
+    """Register the rebuild command."""
     rebuild_parser = subparsers.add_parser(
         "rebuild",
         help="Rebuild state from ledger events",
     )
+    rebuild_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if the snapshot is newer than the ledger",
+    )
     rebuild_parser.set_defaults(func=cmd_rebuild)
 
-    # remote-scan command
+
+def _add_remote_scan_parser(subparsers) -> None:
+    """Register the remote-scan command."""
     remote_parser = subparsers.add_parser(
         "remote-scan",
         help="Scan a remote URL (disabled by default)",
@@ -645,14 +802,18 @@ def main(argv=None) -> int:
     )
     remote_parser.set_defaults(func=cmd_remote_scan)
 
-    # janitor command
+
+def _add_janitor_parser(subparsers) -> None:
+    """Register the janitor command."""
     janitor_parser = subparsers.add_parser(
         "janitor",
         help="Analyze and recommend maintenance",
     )
     janitor_parser.set_defaults(func=cmd_janitor)
 
-    # archive command
+
+def _add_archive_parser(subparsers) -> None:
+    """Register the archive command."""
     archive_parser = subparsers.add_parser(
         "archive",
         help="Archive old cache files",
@@ -668,9 +829,17 @@ def main(argv=None) -> int:
         default=30,
         help="Archive files older than N days (default: 30)",
     )
+    archive_parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Threads moving files (default: 16)",
+    )
     archive_parser.set_defaults(func=cmd_archive)
 
-    # index command
+
+def _add_index_parser(subparsers) -> None:
+    """Register the index command."""
     index_parser = subparsers.add_parser(
         "index",
         help="Manage SQLite index",
@@ -698,7 +867,9 @@ def main(argv=None) -> int:
     )
     index_rebuild_parser.set_defaults(func=cmd_index_rebuild)
 
-    # export command
+
+def _add_export_parser(subparsers) -> None:
+    """Register the export command."""
     export_parser = subparsers.add_parser(
         "export",
         help="Export current Atlas state",
@@ -710,15 +881,97 @@ def main(argv=None) -> int:
     )
     export_parser.set_defaults(func=cmd_export)
 
-    # version command
+
+def _add_serve_parser(subparsers) -> None:
+    """Register the serve command."""
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run commands from stdin (one JSON argv array per line)",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+
+
+def _add_version_parser(subparsers) -> None:
+    """Register the version command."""
     version_parser = subparsers.add_parser(
         "version",
         help="Print version information",
     )
     version_parser.set_defaults(func=cmd_version)
 
+
+_COMMAND_PARSERS = {
+    "scan": _add_scan_parser,
+    "rebuild": _add_rebuild_parser,
+    "remote-scan": _add_remote_scan_parser,
+    "janitor": _add_janitor_parser,
+    "archive": _add_archive_parser,
+    "index": _add_index_parser,
+    "export": _add_export_parser,
+    "serve": _add_serve_parser,
+    "version": _add_version_parser,
+}
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the subcommand name in argv, skipping global options."""
+    args = iter(argv)
+    for arg in args:
+        if arg in ("--ledger-dir", "--state-dir"):
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser, cached per selected command.
+
+    Only the selected command's subparser is registered; None (help,
+    missing or unknown command) registers all of them.
+    """
+    parser = argparse.ArgumentParser(
+        prog="atlas",
+        description="Atlas Core - Universal observation ledger",
+    )
+
+    parser.add_argument(
+        "--ledger-dir",
+        type=str,
+        help="Ledger directory (default: atlas/ledger/events)",
+    )
+
+    parser.add_argument(
+        "--state-dir",
+        type=str,
+        help="State directory (default: atlas/state)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = _COMMAND_PARSERS.get(command)
+    if add_parser is not None:
+        add_parser(subparsers)
+    else:
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    command = _peek_command(argv)
+    if command not in _COMMAND_PARSERS:
+        command = None
+
     # Parse and dispatch
-    args = parser.parse_args(argv)
+    args = _build_parser(command).parse_args(argv)
     return args.func(args)
 
 
@@ -13,15 +13,19 @@ Rules:
 
 from __future__ import annotations
 
+import os
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Iterator, Optional, Protocol
+from typing import Iterable, Iterator, Optional, Protocol
 from uuid import UUID, uuid4
 
 from ..budgets import Budget, BudgetGuard, BudgetType
+from .common import new_hasher
 from ..ledger.events import (
     Event,
     artifact_observed,
@@ -39,6 +43,16 @@ from ..schema import (
 )
 
 
+# Lowercase event names per enum member, built once and interned
+_KIND_NAME = {k: sys.intern(k.name.lower()) for k in ArtifactKind}
+_SCOPE_NAME = {s: sys.intern(s.name.lower()) for s in AccessScope}
+_SOURCE_NAME = {s: sys.intern(s.name.lower()) for s in SourceType}
+_BUDGET_NAME = {b: sys.intern(b.name.lower()) for b in BudgetType}
+
+# Large generated or tooling trees skipped unless hidden files are requested
+DEFAULT_SKIP_NAMES = frozenset({".git", "node_modules", "__pycache__", ".venv"})
+
+
 class ObservationStatus(Enum):
     """Result status of an observation attempt."""
     SUCCESS = auto()
@@ -49,7 +63,7 @@ class ObservationStatus(Enum):
     BUDGET_EXHAUSTED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationResult:
     """Result of observing a single artifact."""
     status: ObservationStatus
@@ -63,17 +77,34 @@ class ObservationResult:
         return self.status in (ObservationStatus.SUCCESS, ObservationStatus.PARTIAL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
-    """Result of a complete scan operation."""
+    """
+    Result of a complete scan operation.
+    
+    Start and end are kept as time.time_ns() stamps; the datetime
+    views are built only when read.
+    """
     source_type: SourceType
-    started_at: datetime
-    ended_at: Optional[datetime] = None
+    started_at_ns: int
+    ended_at_ns: Optional[int] = None
     observations: list[ObservationResult] = field(default_factory=list)
     events: list[Event] = field(default_factory=list)
     budget_exhausted: bool = False
     exhausted_budgets: list[BudgetType] = field(default_factory=list)
     
+    @property
+    def started_at(self) -> datetime:
+        """Scan start as a naive UTC datetime."""
+        return datetime.utcfromtimestamp(self.started_at_ns / 1e9)
+    
+    @property
+    def ended_at(self) -> Optional[datetime]:
+        """Scan end as a naive UTC datetime, or None while running."""
+        if self.ended_at_ns is None:
+            return None
+        return datetime.utcfromtimestamp(self.ended_at_ns / 1e9)
+    
     @property
     def artifact_count(self) -> int:
         return len(self.observations)
@@ -136,10 +167,10 @@ class Eye(ABC):
         return artifact_observed(
             source=self.eye_id,
             artifact_id=artifact_id,
-            artifact_kind=kind.name.lower(),
-            source_type=self.source_type.name.lower(),
+            artifact_kind=_KIND_NAME[kind],
+            source_type=_SOURCE_NAME[self.source_type],
             source_locator=source_locator,
-            access_scope=access_scope.name.lower(),
+            access_scope=_SCOPE_NAME[access_scope],
             session_id=session_id,
         )
     
@@ -211,7 +242,7 @@ class Eye(ABC):
         """Helper to emit budget exhaustion event."""
         return budget_exhausted(
             source=self.eye_id,
-            budget_type=budget_type.name.lower(),
+            budget_type=_BUDGET_NAME[budget_type],
             limit=limit,
             consumed=consumed,
             session_id=session_id,
@@ -238,13 +269,34 @@ class Eye(ABC):
 # Filesystem Eye Implementation
 # -----------------------------------------------------------------------------
 
+# Files are hashed through a reused buffer of this size, one readv per
+# chunk. Nothing is memory-mapped: a mapped file truncated mid-hash
+# kills the process with SIGBUS.
+_READ_BUFFER_SIZE = 64 * 1024
+
+# Readahead hint for multi-chunk files (not available on all platforms)
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+
+
 class FilesystemEye(Eye):
     """
     Eye for observing filesystem artifacts.
     
     Scans directories and files, respecting budget constraints.
+    Fingerprints use SHA-256 unless another hashlib algorithm is named.
     """
     
+    def __init__(
+        self,
+        eye_id: Optional[str] = None,
+        hash_algorithm: str = "sha256",
+    ):
+        super().__init__(eye_id)
+        # Fresh hashers are copied from this; raises ValueError if unknown
+        self._hasher = new_hasher(hash_algorithm)
+        # Small files are read into this; one scan hashes one file at a time
+        self._read_view = memoryview(bytearray(_READ_BUFFER_SIZE))
+    
     @property
     def source_type(self) -> SourceType:
         return SourceType.FILESYSTEM
@@ -257,6 +309,7 @@ class FilesystemEye(Eye):
         session_id: Optional[UUID] = None,
         include_hidden: bool = False,
         file_patterns: Optional[list[str]] = None,
+        skip_names: Iterable[str] = DEFAULT_SKIP_NAMES,
     ) -> ScanResult:
         """
         Scan filesystem starting from root.
@@ -267,10 +320,12 @@ class FilesystemEye(Eye):
             session_id: Optional session identifier
             include_hidden: Whether to include hidden files
             file_patterns: Optional glob patterns to match
+            skip_names: Entry names never descended into; ignored when
+                include_hidden is set
         """
         result = ScanResult(
             source_type=self.source_type,
-            started_at=datetime.utcnow(),
+            started_at_ns=time.time_ns(),
         )
         
         root_path = Path(root)
@@ -280,24 +335,24 @@ class FilesystemEye(Eye):
                 f"Root path does not exist: {root}",
                 session_id=session_id,
             ))
-            result.ended_at = datetime.utcnow()
+            result.ended_at_ns = time.time_ns()
             return result
         
         with BudgetGuard(budget) as guard:
             self._scan_directory(
                 root_path,
-                depth=0,
                 guard=guard,
                 result=result,
                 session_id=session_id,
                 include_hidden=include_hidden,
+                skip_names=frozenset() if include_hidden else frozenset(skip_names),
             )
             
             if budget.any_exhausted:
                 result.budget_exhausted = True
                 result.exhausted_budgets = budget.exhausted_budgets
                 for bt in result.exhausted_budgets:
-                    limit = budget.limits.get(bt)
+                    limit = budget.get_limit(bt)
                     if limit:
                         result.events.append(self._emit_budget_exhausted(
                             bt,
@@ -306,93 +361,120 @@ class FilesystemEye(Eye):
                             session_id=session_id,
                         ))
         
-        result.ended_at = datetime.utcnow()
+        result.ended_at_ns = time.time_ns()
         return result
     
     def _scan_directory(
         self,
-        path: Path,
-        depth: int,
+        root: str | Path,
         guard: BudgetGuard,
         result: ScanResult,
         session_id: Optional[UUID],
         include_hidden: bool,
+        skip_names: frozenset[str],
     ) -> None:
-        """Recursively scan a directory."""
-        if not guard.can_continue():
+        """
+        Walk the tree under root depth-first with an explicit stack.
+        
+        Each stack entry is a directory's remaining entries, so files
+        and subdirectories are visited in the same order a recursive
+        walk would. Running out of budget returns from the whole walk.
+        """
+        if not guard.can_continue() or not guard.at_depth(0):
             return
         
-        if not guard.at_depth(depth):
+        entries = self._list_directory(root, result, session_id)
+        if entries is None:
             return
         
+        stack = [(iter(entries), 0)]
+        while stack:
+            it, depth = stack[-1]
+            for entry in it:
+                if not guard.can_continue():
+                    return
+                
+                # Name checks come first; they never touch the filesystem
+                name = entry.name
+                if name in skip_names:
+                    continue
+                if not include_hidden and name.startswith('.'):
+                    continue
+                
+                if entry.is_file():
+                    self._observe_file(
+                        entry, guard, result, session_id
+                    )
+                elif entry.is_dir() and guard.at_depth(depth + 1):
+                    children = self._list_directory(
+                        entry.path, result, session_id
+                    )
+                    if children is not None:
+                        stack.append((iter(children), depth + 1))
+                        break
+            else:
+                stack.pop()
+    
+    def _list_directory(
+        self,
+        path: str | Path,
+        result: ScanResult,
+        session_id: Optional[UUID],
+    ) -> Optional[list[os.DirEntry]]:
+        """List a directory, recording why if it cannot be read."""
         try:
-            entries = list(path.iterdir())
+            with os.scandir(path) as it:
+                return list(it)
         except PermissionError:
             artifact_id = uuid4()
+            locator = str(path)
             result.observations.append(ObservationResult(
                 status=ObservationStatus.ACCESS_DENIED,
                 artifact_id=artifact_id,
-                source_locator=str(path),
+                source_locator=locator,
                 events=[self._emit_access_denied(
                     artifact_id,
-                    str(path),
+                    locator,
                     "Permission denied",
                     session_id=session_id,
                 )],
             ))
-            return
         except Exception as e:
             result.events.append(self._emit_error(
                 "SCAN_ERROR",
                 f"Error scanning {path}: {e}",
                 session_id=session_id,
             ))
-            return
-        
-        for entry in entries:
-            if not guard.can_continue():
-                return
-            
-            # Skip hidden files unless requested
-            if not include_hidden and entry.name.startswith('.'):
-                continue
-            
-            if entry.is_file():
-                self._observe_file(
-                    entry, guard, result, session_id
-                )
-            elif entry.is_dir():
-                self._scan_directory(
-                    entry,
-                    depth + 1,
-                    guard,
-                    result,
-                    session_id,
-                    include_hidden,
-                )
+        return None
     
     def _observe_file(
         self,
-        path: Path,
+        entry: os.DirEntry,
         guard: BudgetGuard,
         result: ScanResult,
         session_id: Optional[UUID],
     ) -> None:
-        """Observe a single file."""
-        artifact_id = uuid4()
+        """
+        Observe a single file, reusing the stat cached by scandir.
+        
+        Hashed files take their artifact ID from the content hash, so
+        identical contents share an ID; unread files get a random one.
+        """
+        artifact_id: Optional[UUID] = None
         events: list[Event] = []
+        path = entry.path
         
         try:
-            stat = path.stat()
-            size_bytes = stat.st_size
+            size_bytes = entry.stat().st_size
             
             # Check budget before reading
             if not guard.can_consume(BudgetType.BYTES_READ, size_bytes):
                 # Record but don't read
+                artifact_id = uuid4()
                 events.append(self._emit_observation(
                     artifact_id,
                     ArtifactKind.LOCAL,
-                    str(path),
+                    path,
                     AccessScope.METADATA_ONLY,
                     session_id=session_id,
                 ))
@@ -400,22 +482,36 @@ class FilesystemEye(Eye):
                 result.observations.append(ObservationResult(
                     status=ObservationStatus.PARTIAL,
                     artifact_id=artifact_id,
-                    source_locator=str(path),
+                    source_locator=path,
                     events=events,
                 ))
                 return
             
+            try:
+                content_hash = self._compute_hash(path, size_bytes)
+            except Exception:
+                # Still record the read-only observation that failed
+                artifact_id = uuid4()
+                events.append(self._emit_observation(
+                    artifact_id,
+                    ArtifactKind.LOCAL,
+                    path,
+                    AccessScope.READ_ONLY,
+                    session_id=session_id,
+                ))
+                raise
+            artifact_id = UUID(int=int(content_hash[:32], 16))
+            
             # Full observation
             events.append(self._emit_observation(
                 artifact_id,
                 ArtifactKind.LOCAL,
-                str(path),
+                path,
                 AccessScope.READ_ONLY,
                 session_id=session_id,
             ))
             
-            # Compute fingerprint
-            content_hash = self._compute_hash(path)
+            # Fingerprint
             events.append(self._emit_fingerprint(
                 artifact_id,
                 content_hash=content_hash,
@@ -430,46 +526,67 @@ class FilesystemEye(Eye):
             result.observations.append(ObservationResult(
                 status=ObservationStatus.SUCCESS,
                 artifact_id=artifact_id,
-                source_locator=str(path),
+                source_locator=path,
                 events=events,
             ))
             
         except PermissionError:
+            artifact_id = artifact_id or uuid4()
             events.append(self._emit_access_denied(
                 artifact_id,
-                str(path),
+                path,
                 "Permission denied",
                 session_id=session_id,
             ))
             result.observations.append(ObservationResult(
                 status=ObservationStatus.ACCESS_DENIED,
                 artifact_id=artifact_id,
-                source_locator=str(path),
+                source_locator=path,
                 events=events,
             ))
         except Exception as e:
+            artifact_id = artifact_id or uuid4()
+            message = str(e)
             events.append(self._emit_error(
                 "OBSERVATION_ERROR",
-                str(e),
+                message,
                 artifact_ids=(artifact_id,),
                 session_id=session_id,
             ))
             result.observations.append(ObservationResult(
                 status=ObservationStatus.ERROR,
                 artifact_id=artifact_id,
-                source_locator=str(path),
+                source_locator=path,
                 events=events,
-                error_message=str(e),
+                error_message=message,
             ))
     
-    def _compute_hash(self, path: Path) -> str:
-        """Compute SHA-256 hash of file contents."""
-        import hashlib
+    def _compute_hash(
+        self,
+        path: str | Path,
+        size: Optional[int] = None,
+    ) -> str:
+        """
+        Compute content hash of file contents.
         
-        hasher = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                hasher.update(chunk)
+        Files are read with readv into a buffer reused across files,
+        chunk by chunk until EOF. Short reads (NFS, FUSE, signals) and
+        files that changed size since they were sized are hashed as
+        read. Size comes from the caller's stat when known and only
+        decides the readahead hint.
+        """
+        hasher = self._hasher.copy()
+        buf = self._read_view
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if size is None:
+                size = os.fstat(fd).st_size
+            if size > _READ_BUFFER_SIZE and _FADV_SEQUENTIAL is not None:
+                os.posix_fadvise(fd, 0, 0, _FADV_SEQUENTIAL)
+            while n := os.readv(fd, (buf,)):
+                hasher.update(buf[:n])
+        finally:
+            os.close(fd)
         return hasher.hexdigest()
 
 
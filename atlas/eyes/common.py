@@ -0,0 +1,117 @@
+"""
+Atlas Eye Helpers
+
+Hashing and response handling shared by the Eyes.
+"""
+
+import codecs
+import hashlib
+import re
+from dataclasses import dataclass
+
+# Bytes requested from a response per read.
+READ_CHUNK_SIZE = 64 * 1024
+
+# Characters kept in a text excerpt.
+EXCERPT_LENGTH = 500
+
+# Whitespace runs; \s matches exactly what str.split() splits on.
+_WS_RE = re.compile(r"\s+")
+
+# collapse_whitespace first tries this many raw characters per one needed.
+_HEAD_FACTOR = 8
+
+
+def new_hasher(hash_algorithm: str):
+    """
+    Build the prototype hasher that an Eye copies for each artifact.
+
+    Raises:
+        ValueError: If the algorithm is unknown or has no fixed digest
+            size (shake_*), since hexdigest() would fail on every file
+    """
+    hasher = hashlib.new(hash_algorithm)
+    if hasher.digest_size == 0:
+        raise ValueError(
+            f"Hash algorithm {hash_algorithm!r} has variable-length digests"
+        )
+    return hasher
+
+
+@dataclass(slots=True)
+class Body:
+    """What the Eyes keep of a response body; the bytes are dropped."""
+    size: int
+    content_hash: str
+    excerpt: str
+
+
+def collapse_whitespace(text: str, min_length: int) -> str:
+    """
+    Collapse whitespace runs to single spaces and strip the ends.
+
+    Equals " ".join(text.split()) when that is shorter than min_length;
+    otherwise returns a prefix of it at least min_length long. Only a
+    bounded head of text is scanned unless it is mostly whitespace.
+    """
+    head = text[:min_length * _HEAD_FACTOR]
+    collapsed = _WS_RE.sub(" ", head).strip()
+    if len(collapsed) >= min_length or len(head) == len(text):
+        return collapsed
+    return _WS_RE.sub(" ", text).strip()
+
+
+def read_body(
+    response,
+    max_bytes: int,
+    hasher,
+    excerpt_length: int = EXCERPT_LENGTH,
+) -> Body:
+    """
+    Read up to max_bytes of a response in a single pass.
+
+    Chunks are read into one reused buffer, fed to hasher and decoded
+    for the excerpt while still in cache. Decoding stops once the
+    excerpt is settled.
+
+    Args:
+        response: Readable HTTP response
+        max_bytes: Most bytes to read
+        hasher: Fresh hashlib object to fingerprint the body with
+        excerpt_length: Characters to keep in the excerpt
+
+    Returns:
+        Body with the byte count, hex digest and text excerpt
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = ""
+    excerpt = None
+    size = 0
+    # Every chunk is read into the same buffer; nothing keeps the bytes
+    view = memoryview(bytearray(min(READ_CHUNK_SIZE, max_bytes)))
+
+    while size < max_bytes:
+        n = response.readinto(view[:max_bytes - size])
+        if not n:
+            break
+        size += n
+        chunk = view[:n]
+        hasher.update(chunk)
+
+        if excerpt is None:
+            text += decoder.decode(chunk)
+            # Collapsing more text only extends this, so once it is long
+            # enough its head is final
+            collapsed = collapse_whitespace(text, excerpt_length)
+            if len(collapsed) >= excerpt_length:
+                excerpt = collapsed
+
+    if excerpt is None:
+        text += decoder.decode(b"", final=True)
+        excerpt = collapse_whitespace(text, excerpt_length)
+
+    excerpt = excerpt[:excerpt_length]
+    if len(excerpt) == excerpt_length:
+        excerpt = excerpt[:excerpt_length - 3] + "..."
+
+    return Body(size=size, content_hash=hasher.hexdigest(), excerpt=excerpt)
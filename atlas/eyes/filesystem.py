@@ -9,17 +9,77 @@ Rules:
 - Never executes files
 - Respects all budget constraints
 - Emits ACCESS_LIMITATION_NOTED when budgets exceeded
+- Events are buffered and written in batches (one fsync per batch),
+  by default from a background thread
 """
 
-import hashlib
+import os
+import queue
+import threading
 import time
-import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Union
 
 from atlas.budgets import Budget
+from atlas.eyes.common import new_hasher
+from atlas.ids import next_id
 from atlas.ledger.writer import EventWriter
 
+# Buffered events are flushed to the ledger in batches of this size.
+FLUSH_EVERY = 512
+
+# With a hashing pool, up to this many files per worker may be waiting
+# on their hash before the walk pauses to emit finished ones.
+IN_FLIGHT_PER_WORKER = 2
+
+# Batches the background flusher may hold before the scan waits on it.
+MAX_QUEUED_BATCHES = 4
+
+
+class _LedgerFlusher:
+    """
+    Writes event batches on a background thread.
+
+    Batches are written in submission order by a single thread, so the
+    scan keeps walking and hashing while the writer does its write and
+    fsync. The queue is bounded; submit() blocks once it is full. An
+    error from the writer is raised from the next submit() or close().
+    """
+
+    def __init__(self, max_batches: int = MAX_QUEUED_BATCHES):
+        self._queue: queue.Queue = queue.Queue(max_batches)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="atlas-ledger-flush", daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            # After a failure keep draining so submitters never block
+            if self._error is None:
+                write, batch = item
+                try:
+                    write(batch)
+                except BaseException as e:
+                    self._error = e
+
+    def submit(self, write: Callable[[list], object], batch: list) -> None:
+        """Queue write(batch) behind every batch submitted before it."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put((write, batch))
+
+    def close(self) -> None:
+        """Wait for queued batches to be written."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
 
 class FilesystemEye:
     """
@@ -30,63 +90,181 @@ class FilesystemEye:
     - max_files: Maximum files to observe
     - max_bytes: Maximum total bytes to account
     - max_depth: Maximum directory depth from root
+
+    The walk and all budget accounting run on the calling thread, so
+    results are identical for any worker count. With workers > 1 the
+    content hashing of accepted files runs on a thread pool alongside
+    the walk, and events are still emitted in walk order.
+
+    Content hashes use SHA-256 by default, which OpenSSL accelerates
+    with SHA-NI/ARMv8 crypto instructions. Any fixed-size hashlib
+    algorithm can be chosen instead, e.g. "blake2b" on CPUs without
+    them; artifact IDs derive from the hash, so changing it changes
+    the IDs.
     """
 
-    def __init__(self, writer: EventWriter):
+    def __init__(self, writer: EventWriter, hash_algorithm: str = "sha256"):
         self.writer = writer
         self.module_name = "FilesystemEye"
+        self._pending: list[Union[dict, str]] = []
+        # Set while observe() writes through a background thread
+        self._flusher: Optional[_LedgerFlusher] = None
+        # Fresh hashers are copied from this; raises ValueError if unknown
+        self._hasher = new_hasher(hash_algorithm)
+        # Non-strict writers take ARTIFACT_SEEN events as lines formatted
+        # here; strict ones get dicts so they can validate them
+        self._raw_seen = not getattr(writer, "strict", False)
+        # Same text the writer's encoder produces for the dict below
+        self._seen_line = (
+            '{"event_id": %s, "event_type": "ARTIFACT_SEEN", "ts": %r, '
+            '"actor": {"module": ' + encode_basestring(self.module_name)
+            + '}, "artifact_id": %s, "confidence": %r, "evidence_refs": [], '
+            '"payload": {"path": %s, "size": %d, "content_hash": %s, '
+            '"access_scope": "read-only"}%s}\n'
+        )
+        # ARTIFACT_SEEN events are shallow copies of these with the
+        # per-file fields filled in; every event shares the actor dict
+        self._seen_template = {
+            "event_id": None,
+            "event_type": "ARTIFACT_SEEN",
+            "ts": None,
+            "actor": {"module": self.module_name},
+            "artifact_id": None,
+            "confidence": None,
+            "evidence_refs": None,
+            "payload": None,
+        }
+        self._seen_payload_template = {
+            "path": None,
+            "size": None,
+            "content_hash": None,
+            "access_scope": "read-only",
+        }
+
+    def _buffer(self, event: Union[dict, str]) -> None:
+        """Queue event for the ledger, flushing once a batch is full."""
+        self._pending.append(event)
+        if len(self._pending) >= FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write all buffered events in one batch."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            if self._raw_seen:
+                self._write(self.writer.append_lines, pending)
+            else:
+                self._write(self.writer.append_many, pending)
+
+    def _write(self, write: Callable[[list], object], batch: list) -> None:
+        """Hand a batch to the background flusher, or write it now."""
+        if self._flusher is not None:
+            self._flusher.submit(write, batch)
+        else:
+            write(batch)
 
     def _make_event_id(self) -> str:
         """Generate unique event ID."""
-        return f"fs-{uuid.uuid4().hex[:16]}"
+        return next_id("fs", 8)
 
-    def _compute_hash(self, path: Path) -> Optional[str]:
-        """Compute SHA-256 hash of first 4096 bytes."""
+    def _compute_hash(self, path: str) -> Optional[str]:
+        """Compute content hash of first 4096 bytes."""
         try:
             with open(path, "rb") as f:
                 data = f.read(4096)
-                return hashlib.sha256(data).hexdigest()
-        except Exception:
+        except OSError:
             return None
+        hasher = self._hasher.copy()
+        hasher.update(data)
+        return hasher.hexdigest()
 
-    def _get_depth(self, path: Path, root: Path) -> int:
-        """Calculate depth relative to root path."""
-        try:
-            rel = path.relative_to(root)
-            return len(rel.parts) - 1  # -1 because file itself doesn't count as depth
-        except ValueError:
-            return 0
+    def _walk(
+        self,
+        root: str,
+        max_depth: float,
+        skip_dir: Optional[str] = None,
+        on_error: Optional[Callable[[OSError], None]] = None,
+    ) -> Iterator[tuple[os.DirEntry, int]]:
+        """
+        Yield (entry, depth) for every file under root.
+
+        Same order as Path.rglob("*"): each directory's entries in
+        scandir order, subdirectories depth-first. Depth counts the
+        directories between root and the file. Directories whose files
+        would be at max_depth or deeper are not entered, nor is
+        skip_dir. Symlinked files are yielded, symlinked directories
+        are not followed, and unreadable entries are skipped after
+        being passed to on_error, as with os.walk.
+        """
+        stack = [(root, 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError as e:
+                if on_error is not None:
+                    on_error(e)
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        yield entry, depth
+                    elif (
+                        entry.is_dir(follow_symlinks=False)
+                        and depth + 1 < max_depth
+                        and entry.path != skip_dir
+                    ):
+                        subdirs.append((entry.path, depth + 1))
+                except OSError as e:
+                    if on_error is not None:
+                        on_error(e)
+
+            stack.extend(reversed(subdirs))
 
     def _emit_artifact_seen(
         self,
-        path: Path,
+        path: str,
         size: int,
         content_hash: Optional[str],
         session_id: Optional[str] = None,
     ) -> None:
-        """Emit ARTIFACT_SEEN event."""
-        artifact_id = content_hash or self._make_event_id()
-
-        event = {
-            "event_id": self._make_event_id(),
-            "event_type": "ARTIFACT_SEEN",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
-            "artifact_id": artifact_id,
-            "confidence": 0.95 if content_hash else 0.5,
-            "evidence_refs": [],
-            "payload": {
-                "path": str(path),
-                "size": size,
-                "content_hash": content_hash,
-                "access_scope": "read-only",
-            },
-        }
+        """Emit ARTIFACT_SEEN event for the walk's path string."""
+        if self._raw_seen:
+            event_id = self._make_event_id()
+            self._buffer(self._seen_line % (
+                encode_basestring(event_id),
+                time.time(),
+                encode_basestring(content_hash or self._make_event_id()),
+                0.95 if content_hash else 0.5,
+                encode_basestring(path),
+                size,
+                "null" if content_hash is None
+                else encode_basestring(content_hash),
+                ', "session_id": ' + encode_basestring(session_id)
+                if session_id else "",
+            ))
+            return
+
+        payload = self._seen_payload_template.copy()
+        payload["path"] = path
+        payload["size"] = size
+        payload["content_hash"] = content_hash
+
+        event = self._seen_template.copy()
+        event["event_id"] = self._make_event_id()
+        event["ts"] = time.time()
+        event["artifact_id"] = content_hash or self._make_event_id()
+        event["confidence"] = 0.95 if content_hash else 0.5
+        event["evidence_refs"] = []
+        event["payload"] = payload
 
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
+        self._buffer(event)
 
     def _emit_access_limitation(
         self,
@@ -117,13 +295,20 @@ class FilesystemEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
+        if self._raw_seen:
+            # Lines queued so far go first, keeping ledger order
+            self._flush()
+            self._write(self.writer.append_many, [event])
+        else:
+            self._buffer(event)
 
     def observe(
         self,
         root: str,
         budget: Budget,
         session_id: Optional[str] = None,
+        workers: int = 1,
+        background_writes: bool = True,
     ) -> dict:
         """
         Observe filesystem starting from root path.
@@ -132,9 +317,13 @@ class FilesystemEye:
             root: Root directory path to scan
             budget: Budget constraints to enforce
             session_id: Optional session identifier
+            workers: Threads used to hash accepted files
+            background_writes: Write event batches from a separate
+                thread; all are written before observe returns
 
         Returns:
             Summary dict with files_seen, bytes_accounted, stopped_reason
+            and entries_skipped
         """
         root_path = Path(root).resolve()
 
@@ -143,9 +332,10 @@ class FilesystemEye:
                 "files_seen": 0,
                 "bytes_accounted": 0,
                 "stopped_reason": "root_not_found",
+                "entries_skipped": 0,
             }
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         files_seen = 0
         bytes_accounted = 0
         stopped_reason = None
@@ -160,27 +350,65 @@ class FilesystemEye:
         max_depth = getattr(budget, "max_depth", None)
         max_depth = max_depth if max_depth is not None else float("inf")
 
-        def check_time_budget() -> bool:
-            elapsed_ms = (time.time() - start_time) * 1000
-            return elapsed_ms < max_time_ms
+        # Time budget as a monotonic deadline; no clock reads if unlimited
+        deadline_ns = (
+            start_ns + int(max_time_ms * 1_000_000)
+            if max_time_ms != float("inf") else None
+        )
+
+        # Accepted files whose hash is still being computed, in walk
+        # order; the walk keeps going while the pool hashes them
+        in_flight: deque[tuple[str, int, Future]] = deque()
+        pool = ThreadPoolExecutor(workers) if workers > 1 else None
+        max_in_flight = IN_FLIGHT_PER_WORKER * workers
+
+        def emit_hashed(keep: int = 0) -> None:
+            # Emit finished files in order until at most `keep` remain
+            while len(in_flight) > keep:
+                path, size, future = in_flight.popleft()
+                self._emit_artifact_seen(
+                    path=path,
+                    size=size,
+                    content_hash=future.result(),
+                    session_id=session_id,
+                )
 
-        # Walk directory tree
-        try:
-            for path in root_path.rglob("*"):
-                # Skip ledger directory to avoid self-observation
-                try:
-                    if self.writer.ledger_dir and path.is_relative_to(self.writer.ledger_dir):
-                        continue
-                except (AttributeError, ValueError):
-                    pass
-                
-                # Skip non-files
-                if not path.is_file():
-                    continue
+        def accept(path: str, size: int) -> None:
+            if pool is None:
+                self._emit_artifact_seen(
+                    path=path,
+                    size=size,
+                    content_hash=self._compute_hash(path),
+                    session_id=session_id,
+                )
+                return
+            in_flight.append((path, size, pool.submit(self._compute_hash, path)))
+            if len(in_flight) > max_in_flight:
+                emit_hashed(keep=max_in_flight)
+
+        # Unreadable entries are counted and reported once at the end
+        entries_skipped = 0
+
+        def skip(error: OSError) -> None:
+            nonlocal entries_skipped
+            entries_skipped += 1
+
+        # Walk directory tree, never entering the ledger directory
+        # to avoid self-observation
+        ledger_dir = getattr(self.writer, "ledger_dir", None)
+        skip_dir = os.path.realpath(ledger_dir) if ledger_dir else None
 
+        if background_writes:
+            self._flusher = _LedgerFlusher()
+
+        try:
+            for entry, depth in self._walk(
+                str(root_path), max_depth, skip_dir, on_error=skip,
+            ):
                 # Check time budget
-                if not check_time_budget():
-                    elapsed_ms = (time.time() - start_time) * 1000
+                if deadline_ns is not None and time.monotonic_ns() >= deadline_ns:
+                    elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+                    emit_hashed()
                     self._emit_access_limitation(
                         reason="Time budget exceeded",
                         limit_type="max_time_ms",
@@ -193,6 +421,7 @@ class FilesystemEye:
 
                 # Check file count budget
                 if files_seen >= max_files:
+                    emit_hashed()
                     self._emit_access_limitation(
                         reason="File count budget exceeded",
                         limit_type="max_files",
@@ -204,18 +433,19 @@ class FilesystemEye:
                     break
 
                 # Check depth (skip silently if too deep)
-                depth = self._get_depth(path, root_path)
                 if depth >= max_depth:
                     continue
 
                 # Get file size
                 try:
-                    size = path.stat().st_size
-                except Exception:
+                    size = entry.stat().st_size
+                except OSError as e:
+                    skip(e)
                     continue
 
                 # Check byte budget before accounting
                 if bytes_accounted + size > max_bytes:
+                    emit_hashed()
                     self._emit_access_limitation(
                         reason="Byte budget would be exceeded",
                         limit_type="max_bytes",
@@ -226,33 +456,37 @@ class FilesystemEye:
                     stopped_reason = "max_bytes"
                     break
 
-                # Compute hash (first 4096 bytes only)
-                content_hash = self._compute_hash(path)
-
-                # Emit observation event
-                self._emit_artifact_seen(
-                    path=path,
-                    size=size,
-                    content_hash=content_hash,
-                    session_id=session_id,
-                )
+                # Hash (first 4096 bytes only) and emit
+                accept(entry.path, size)
 
                 # Update counters
                 files_seen += 1
                 bytes_accounted += size
 
-        except PermissionError:
-            self._emit_access_limitation(
-                reason="Permission denied during traversal",
-                limit_type="access",
-                limit_value=0,
-                current_value=0,
-                session_id=session_id,
-            )
-            stopped_reason = "permission_denied"
+            emit_hashed()
+
+            if entries_skipped:
+                self._emit_access_limitation(
+                    reason="Unreadable entries skipped",
+                    limit_type="unreadable",
+                    limit_value=0,
+                    current_value=entries_skipped,
+                    session_id=session_id,
+                )
+
+        finally:
+            if pool:
+                pool.shutdown()
+            try:
+                self._flush()
+            finally:
+                flusher, self._flusher = self._flusher, None
+                if flusher is not None:
+                    flusher.close()
 
         return {
             "files_seen": files_seen,
             "bytes_accounted": bytes_accounted,
             "stopped_reason": stopped_reason,
+            "entries_skipped": entries_skipped,
         }
@@ -5,20 +5,43 @@ Read-only observer for remote repositories (GitHub, etc).
 No crawling beyond manifest files.
 """
 
-import hashlib
 import re
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
-from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
+from atlas.eyes.common import Body, new_hasher, read_body
+from atlas.ids import next_id
+from atlas.remote.connections import ConnectionPool
 from atlas.remote.policy import (
     RemotePolicy,
     estimate_source_reliability,
     estimate_volatility,
 )
 
+# observe_repo fetches at most this many candidates at once.
+MAX_CONCURRENT_FETCHES = 8
+
+# github.com/owner/repo, with optional .git suffix and trailing path.
+_GITHUB_RE = re.compile(
+    r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$"
+)
+
+
+@dataclass(slots=True)
+class _Fetch:
+    """Outcome of fetching one URL, before any events are emitted."""
+    max_time_ms: float
+    max_bytes: int
+    body: Optional[Body] = None
+    http_status: int = 0
+    content_type: str = ""
+    truncated: bool = False
+    elapsed_ms: float = 0.0
+    error: Optional[Exception] = None
+
 
 class RemoteRepoEye:
     """
@@ -50,19 +73,26 @@ class RemoteRepoEye:
         "go.mod",
     ]
 
-    def __init__(self, writer):
+    def __init__(self, writer, hash_algorithm: str = "sha256"):
         """
         Initialize RemoteRepoEye.
 
         Args:
             writer: EventWriter for emitting events
+            hash_algorithm: Fixed-size hashlib algorithm for fingerprints
         """
         self.writer = writer
         self.module_name = "RemoteRepoEye"
+        # Shared by every event this eye emits
+        self._actor = {"module": self.module_name}
+        # Fresh hashers are copied from this; raises ValueError if unknown
+        self._hasher = new_hasher(hash_algorithm)
+        # Keep-alive connections shared by every fetch of this eye
+        self._connections = ConnectionPool()
 
     def _make_event_id(self) -> str:
         """Generate unique event ID."""
-        return f"repo-{uuid.uuid4().hex[:16]}"
+        return next_id("repo", 8)
 
     def can_handle(self, locator: str) -> bool:
         """Check if this eye can handle the locator."""
@@ -76,11 +106,7 @@ class RemoteRepoEye:
         """Parse GitHub URL into (owner, repo)."""
         url = url.replace("git+https://", "https://")
 
-        # Match github.com/owner/repo pattern
-        match = re.match(
-            r"https://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$",
-            url,
-        )
+        match = _GITHUB_RE.match(url)
         if match:
             return match.group(1), match.group(2)
         return None
@@ -136,79 +162,102 @@ class RemoteRepoEye:
         Returns:
             Result dict with status and artifact info
         """
-        start_time = time.time()
-
         # Check policy
         allowed, reason = remote_policy.can_access(url)
         if not allowed:
-            self._emit_remote_lookup_declined(
-                url=url,
-                reason=reason,
-                session_id=session_id,
-            )
-            return {
-                "status": "declined",
-                "reason": reason,
-                "artifact_id": None,
-            }
+            return self._decline(url, reason, session_id)
+
+        remote_policy.record_call()
+        fetch = self._fetch(url, budget, remote_policy)
+        return self._record(url, fetch, remote_policy, session_id)
+
+    def _decline(
+        self,
+        url: str,
+        reason: str,
+        session_id: Optional[str],
+    ) -> dict:
+        """Record a URL the policy refused."""
+        self._emit_remote_lookup_declined(
+            url=url,
+            reason=reason,
+            ts=time.time(),
+            session_id=session_id,
+        )
+        return {
+            "status": "declined",
+            "reason": reason,
+            "artifact_id": None,
+        }
+
+    def _fetch(self, url: str, budget, remote_policy: RemotePolicy) -> _Fetch:
+        """
+        Fetch one admitted URL without emitting anything.
+
+        Safe to run on a worker thread; _record emits the outcome.
+        """
+        start_time = time.time()
 
         # Get budget limits
         max_time_ms = getattr(budget, "max_time_ms", None) or float("inf")
         max_bytes = getattr(budget, "max_bytes_per_artifact", None)
         if max_bytes is None:
             max_bytes = getattr(budget, "max_bytes", None) or 1_000_000
+        fetch = _Fetch(max_time_ms=max_time_ms, max_bytes=max_bytes)
 
-        # Fetch URL
         try:
-            remote_policy.record_call()
-
             headers = {"User-Agent": remote_policy.user_agent}
 
             # Add Accept header for GitHub API
             if "api.github.com" in url:
                 headers["Accept"] = "application/vnd.github.v3+json"
 
-            req = Request(url, headers=headers)
-
-            with urlopen(
-                req,
+            with self._connections.open(
+                url,
+                headers,
                 timeout=remote_policy.request_timeout_seconds,
             ) as response:
                 # Check time
                 elapsed_ms = (time.time() - start_time) * 1000
                 if elapsed_ms > max_time_ms:
-                    self._emit_access_limitation(
-                        url=url,
-                        reason="Time budget exceeded",
-                        limit_type="max_time_ms",
-                        limit_value=max_time_ms,
-                        current_value=elapsed_ms,
-                        session_id=session_id,
-                    )
-                    return {
-                        "status": "timeout",
-                        "reason": "Time budget exceeded",
-                        "artifact_id": None,
-                    }
-
-                content = response.read(max_bytes)
-                content_length = len(content)
-                http_status = response.status
-                content_type = response.headers.get(
+                    fetch.elapsed_ms = elapsed_ms
+                    return fetch
+
+                # Hash here so concurrent fetches hash in parallel;
+                # hashlib drops the GIL for buffers over 2 KiB
+                fetch.body = read_body(
+                    response, max_bytes, self._hasher.copy(),
+                )
+                fetch.http_status = response.status
+                fetch.content_type = response.headers.get(
                     "Content-Type", "application/octet-stream"
                 )
 
                 # Check truncation
-                truncated = False
                 full_length = response.headers.get("Content-Length")
                 if full_length:
                     try:
-                        if int(full_length) > content_length:
-                            truncated = True
+                        if int(full_length) > fetch.body.size:
+                            fetch.truncated = True
                     except ValueError:
                         pass
 
-        except HTTPError as e:
+        except Exception as e:
+            fetch.error = e
+
+        return fetch
+
+    def _record(
+        self,
+        url: str,
+        fetch: _Fetch,
+        remote_policy: RemotePolicy,
+        session_id: Optional[str],
+    ) -> dict:
+        """Emit the events for a finished fetch and build its result."""
+        now = time.time()
+        e = fetch.error
+        if isinstance(e, HTTPError):
             if e.code == 404:
                 # File doesn't exist - not an error for optional manifests
                 return {
@@ -222,6 +271,7 @@ class RemoteRepoEye:
                 limit_type="http_error",
                 limit_value=0,
                 current_value=e.code,
+                ts=now,
                 session_id=session_id,
             )
             return {
@@ -230,13 +280,14 @@ class RemoteRepoEye:
                 "artifact_id": None,
             }
 
-        except URLError as e:
+        if isinstance(e, URLError):
             self._emit_access_limitation(
                 url=url,
                 reason=f"URL error: {e.reason}",
                 limit_type="url_error",
                 limit_value=0,
                 current_value=0,
+                ts=now,
                 session_id=session_id,
             )
             return {
@@ -245,19 +296,36 @@ class RemoteRepoEye:
                 "artifact_id": None,
             }
 
-        except Exception as e:
+        if e is not None:
             return {
                 "status": "error",
                 "reason": str(e),
                 "artifact_id": None,
             }
 
-        # Compute hash
-        content_hash = hashlib.sha256(content).hexdigest()
+        if fetch.body is None:
+            self._emit_access_limitation(
+                url=url,
+                reason="Time budget exceeded",
+                limit_type="max_time_ms",
+                limit_value=fetch.max_time_ms,
+                current_value=fetch.elapsed_ms,
+                ts=now,
+                session_id=session_id,
+            )
+            return {
+                "status": "timeout",
+                "reason": "Time budget exceeded",
+                "artifact_id": None,
+            }
+
+        content_length = fetch.body.size
+        content_type = fetch.content_type
+
+        content_hash = fetch.body.content_hash
         artifact_id = content_hash
 
         # Build remote metadata
-        now = time.time()
         allowlist = remote_policy.required_domains_allowlist or []
         remote_meta = {
             "source_reliability": estimate_source_reliability(url, allowlist),
@@ -267,50 +335,53 @@ class RemoteRepoEye:
             "corroboration_count": 1,
         }
 
-        # Emit events
-        self._emit_artifact_seen(
-            artifact_id=artifact_id,
-            url=url,
-            size=content_length,
-            content_type=content_type,
-            remote_meta=remote_meta,
-            session_id=session_id,
-        )
-
-        self._emit_fingerprint_computed(
-            artifact_id=artifact_id,
-            content_hash=content_hash,
-            size_bytes=content_length,
-            session_id=session_id,
-        )
-
-        text_excerpt = self._extract_text_excerpt(content, content_type)
-        self._emit_extraction_performed(
-            artifact_id=artifact_id,
-            url=url,
-            http_status=http_status,
-            content_type=content_type,
-            text_excerpt=text_excerpt,
-            remote_meta=remote_meta,
-            session_id=session_id,
-        )
-
-        if truncated:
-            self._emit_access_limitation(
+        # Write the observation's events in one batch
+        events = [
+            self._build_artifact_seen(
+                artifact_id=artifact_id,
+                url=url,
+                size=content_length,
+                content_type=content_type,
+                remote_meta=remote_meta,
+                ts=now,
+                session_id=session_id,
+            ),
+            self._build_fingerprint_computed(
+                artifact_id=artifact_id,
+                content_hash=content_hash,
+                size_bytes=content_length,
+                ts=now,
+                session_id=session_id,
+            ),
+            self._build_extraction_performed(
+                artifact_id=artifact_id,
+                url=url,
+                http_status=fetch.http_status,
+                content_type=content_type,
+                text_excerpt=fetch.body.excerpt,
+                remote_meta=remote_meta,
+                ts=now,
+                session_id=session_id,
+            ),
+        ]
+        if fetch.truncated:
+            events.append(self._build_access_limitation(
                 url=url,
                 reason="Content truncated",
                 limit_type="max_bytes",
-                limit_value=max_bytes,
+                limit_value=fetch.max_bytes,
                 current_value=content_length,
+                ts=now,
                 session_id=session_id,
-            )
+            ))
+        self.writer.append_many(events)
 
         return {
             "status": "success",
             "artifact_id": artifact_id,
             "content_hash": content_hash,
             "size": content_length,
-            "truncated": truncated,
+            "truncated": fetch.truncated,
         }
 
     def observe_repo(
@@ -319,62 +390,73 @@ class RemoteRepoEye:
         budget,
         remote_policy: RemotePolicy,
         session_id: Optional[str] = None,
+        workers: int = MAX_CONCURRENT_FETCHES,
     ) -> list[dict]:
         """
         Observe a repository and its manifest files.
 
+        Candidates are admitted against the policy in order, exactly
+        as one observe() call each would be, then the admitted URLs
+        are fetched concurrently. Events are emitted in candidate order
+        once each fetch completes, so the ledger matches a serial run.
+
         Args:
             repo_url: Repository URL
             budget: Budget constraints
             remote_policy: Remote access policy
             session_id: Optional session ID
+            workers: Maximum fetches in flight at once
 
         Returns:
             List of result dicts for each observed file
         """
-        results = []
-        candidates = self.enumerate(repo_url)
-
-        for candidate in candidates:
-            result = self.observe(
-                url=candidate,
-                budget=budget,
-                remote_policy=remote_policy,
-                session_id=session_id,
-            )
-            results.append({
-                "url": candidate,
-                **result,
-            })
+        # (url, refusal reason or None if admitted)
+        admitted: list[tuple[str, Optional[str]]] = []
+        for candidate in self.enumerate(repo_url):
+            allowed, reason = remote_policy.can_access(candidate)
+            if allowed:
+                remote_policy.record_call()
+                admitted.append((candidate, None))
+            else:
+                admitted.append((candidate, reason))
 
             # Check if we've hit call limit
             if remote_policy.calls_made >= remote_policy.max_remote_calls:
                 break
 
-        return results
+        to_fetch = [url for url, refused in admitted if refused is None]
+        if workers > 1 and len(to_fetch) > 1:
+            with ThreadPoolExecutor(min(workers, len(to_fetch))) as pool:
+                fetches = list(pool.map(
+                    lambda url: self._fetch(url, budget, remote_policy),
+                    to_fetch,
+                ))
+        else:
+            fetches = [
+                self._fetch(url, budget, remote_policy) for url in to_fetch
+            ]
+        fetched = iter(fetches)
 
-    def _extract_text_excerpt(
-        self,
-        content: bytes,
-        content_type: str,
-        max_length: int = 500,
-    ) -> str:
-        """Extract text excerpt from content."""
-        try:
-            text = content.decode("utf-8", errors="replace")
-        except Exception:
-            text = content.decode("latin-1", errors="replace")
-
-        text = " ".join(text.split())[:max_length]
-        if len(text) == max_length:
-            text = text[:max_length - 3] + "..."
+        results = []
+        for candidate, refused in admitted:
+            if refused is not None:
+                result = self._decline(candidate, refused, session_id)
+            else:
+                result = self._record(
+                    candidate, next(fetched), remote_policy, session_id,
+                )
+            results.append({
+                "url": candidate,
+                **result,
+            })
 
-        return text
+        return results
 
     def _emit_remote_lookup_declined(
         self,
         url: str,
         reason: str,
+        ts: float,
         session_id: Optional[str] = None,
     ) -> str:
         """Emit REMOTE_LOOKUP_DECLINED event."""
@@ -383,8 +465,8 @@ class RemoteRepoEye:
         event = {
             "event_id": event_id,
             "event_type": "REMOTE_LOOKUP_DECLINED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": None,
             "confidence": 1.0,
             "evidence_refs": [],
@@ -401,23 +483,22 @@ class RemoteRepoEye:
         self.writer.append(event)
         return event_id
 
-    def _emit_artifact_seen(
+    def _build_artifact_seen(
         self,
         artifact_id: str,
         url: str,
         size: int,
         content_type: str,
         remote_meta: dict,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit ARTIFACT_SEEN event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build ARTIFACT_SEEN event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "ARTIFACT_SEEN",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 0.9 * remote_meta.get("source_reliability", 0.5),
             "evidence_refs": [],
@@ -434,30 +515,28 @@ class RemoteRepoEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_fingerprint_computed(
+    def _build_fingerprint_computed(
         self,
         artifact_id: str,
         content_hash: str,
         size_bytes: int,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit FINGERPRINT_COMPUTED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build FINGERPRINT_COMPUTED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "FINGERPRINT_COMPUTED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 1.0,
             "evidence_refs": [],
             "payload": {
                 "content_hash": content_hash,
-                "hash_algorithm": "sha256",
+                "hash_algorithm": self._hasher.name,
                 "size_bytes": size_bytes,
             },
         }
@@ -465,10 +544,9 @@ class RemoteRepoEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_extraction_performed(
+    def _build_extraction_performed(
         self,
         artifact_id: str,
         url: str,
@@ -476,16 +554,15 @@ class RemoteRepoEye:
         content_type: str,
         text_excerpt: str,
         remote_meta: dict,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit EXTRACTION_PERFORMED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build EXTRACTION_PERFORMED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "EXTRACTION_PERFORMED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 0.8,
             "evidence_refs": [],
@@ -504,26 +581,24 @@ class RemoteRepoEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_access_limitation(
+    def _build_access_limitation(
         self,
         url: str,
         reason: str,
         limit_type: str,
         limit_value: float,
         current_value: float,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit ACCESS_LIMITATION_NOTED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build ACCESS_LIMITATION_NOTED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "ACCESS_LIMITATION_NOTED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": None,
             "confidence": 1.0,
             "evidence_refs": [],
@@ -540,5 +615,27 @@ class RemoteRepoEye:
         if session_id:
             event["session_id"] = session_id
 
+        return event
+
+    def _emit_access_limitation(
+        self,
+        url: str,
+        reason: str,
+        limit_type: str,
+        limit_value: float,
+        current_value: float,
+        ts: float,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """Emit ACCESS_LIMITATION_NOTED event."""
+        event = self._build_access_limitation(
+            url=url,
+            reason=reason,
+            limit_type=limit_type,
+            limit_value=limit_value,
+            current_value=current_value,
+            ts=ts,
+            session_id=session_id,
+        )
         self.writer.append(event)
-        return event_id
+        return event["event_id"]
@@ -5,13 +5,13 @@ Read-only observer for web URLs.
 No crawling, no link following, no silent updates.
 """
 
-import hashlib
 import time
-import uuid
 from typing import Optional
-from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
+from atlas.eyes.common import new_hasher, read_body
+from atlas.ids import next_id
+from atlas.remote.connections import ConnectionPool
 from atlas.remote.policy import (
     RemotePolicy,
     estimate_source_reliability,
@@ -30,19 +30,26 @@ class WebEye:
     - All fetched data marked as remote with decay metadata
     """
 
-    def __init__(self, writer):
+    def __init__(self, writer, hash_algorithm: str = "sha256"):
         """
         Initialize WebEye.
 
         Args:
             writer: EventWriter for emitting events
+            hash_algorithm: Fixed-size hashlib algorithm for fingerprints
         """
         self.writer = writer
         self.module_name = "WebEye"
+        # Shared by every event this eye emits
+        self._actor = {"module": self.module_name}
+        # Fresh hashers are copied from this; raises ValueError if unknown
+        self._hasher = new_hasher(hash_algorithm)
+        # Keep-alive connections shared by every fetch of this eye
+        self._connections = ConnectionPool()
 
     def _make_event_id(self) -> str:
         """Generate unique event ID."""
-        return f"web-{uuid.uuid4().hex[:16]}"
+        return next_id("web", 8)
 
     def can_handle(self, locator: str) -> bool:
         """Check if this eye can handle the locator."""
@@ -89,6 +96,7 @@ class WebEye:
             self._emit_remote_lookup_declined(
                 url=url,
                 reason=reason,
+                ts=start_time,
                 session_id=session_id,
             )
             return {
@@ -107,17 +115,14 @@ class WebEye:
         try:
             remote_policy.record_call()
 
-            req = Request(
+            with self._connections.open(
                 url,
-                headers={"User-Agent": remote_policy.user_agent},
-            )
-
-            with urlopen(
-                req,
+                {"User-Agent": remote_policy.user_agent},
                 timeout=remote_policy.request_timeout_seconds,
             ) as response:
                 # Check time budget
-                elapsed_ms = (time.time() - start_time) * 1000
+                now = time.time()
+                elapsed_ms = (now - start_time) * 1000
                 if elapsed_ms > max_time_ms:
                     self._emit_access_limitation(
                         url=url,
@@ -125,6 +130,7 @@ class WebEye:
                         limit_type="max_time_ms",
                         limit_value=max_time_ms,
                         current_value=elapsed_ms,
+                        ts=now,
                         session_id=session_id,
                     )
                     return {
@@ -133,9 +139,9 @@ class WebEye:
                         "artifact_id": None,
                     }
 
-                # Read limited bytes
-                content = response.read(max_bytes)
-                content_length = len(content)
+                # Read limited bytes, hashing as they arrive
+                body = read_body(response, max_bytes, self._hasher.copy())
+                content_length = body.size
 
                 # Get metadata
                 http_status = response.status
@@ -160,6 +166,7 @@ class WebEye:
                 limit_type="http_error",
                 limit_value=0,
                 current_value=e.code,
+                ts=time.time(),
                 session_id=session_id,
             )
             return {
@@ -175,6 +182,7 @@ class WebEye:
                 limit_type="url_error",
                 limit_value=0,
                 current_value=0,
+                ts=time.time(),
                 session_id=session_id,
             )
             return {
@@ -190,6 +198,7 @@ class WebEye:
                 limit_type="exception",
                 limit_value=0,
                 current_value=0,
+                ts=time.time(),
                 session_id=session_id,
             )
             return {
@@ -198,8 +207,7 @@ class WebEye:
                 "artifact_id": None,
             }
 
-        # Compute hash
-        content_hash = hashlib.sha256(content).hexdigest()
+        content_hash = body.content_hash
         artifact_id = content_hash
 
         # Build remote metadata
@@ -213,46 +221,47 @@ class WebEye:
             "corroboration_count": 1,
         }
 
-        # Emit ARTIFACT_SEEN
-        self._emit_artifact_seen(
-            artifact_id=artifact_id,
-            url=url,
-            size=content_length,
-            content_type=content_type,
-            remote_meta=remote_meta,
-            session_id=session_id,
-        )
-
-        # Emit FINGERPRINT_COMPUTED
-        self._emit_fingerprint_computed(
-            artifact_id=artifact_id,
-            content_hash=content_hash,
-            size_bytes=content_length,
-            session_id=session_id,
-        )
-
-        # Emit EXTRACTION_PERFORMED
-        text_excerpt = self._extract_text_excerpt(content, content_type)
-        self._emit_extraction_performed(
-            artifact_id=artifact_id,
-            url=url,
-            http_status=http_status,
-            content_type=content_type,
-            text_excerpt=text_excerpt,
-            remote_meta=remote_meta,
-            session_id=session_id,
-        )
-
-        # Emit limitation if truncated
+        # ARTIFACT_SEEN, FINGERPRINT_COMPUTED and EXTRACTION_PERFORMED,
+        # plus a limitation if truncated, go to the ledger in one write
+        events = [
+            self._build_artifact_seen(
+                artifact_id=artifact_id,
+                url=url,
+                size=content_length,
+                content_type=content_type,
+                remote_meta=remote_meta,
+                ts=now,
+                session_id=session_id,
+            ),
+            self._build_fingerprint_computed(
+                artifact_id=artifact_id,
+                content_hash=content_hash,
+                size_bytes=content_length,
+                ts=now,
+                session_id=session_id,
+            ),
+            self._build_extraction_performed(
+                artifact_id=artifact_id,
+                url=url,
+                http_status=http_status,
+                content_type=content_type,
+                text_excerpt=body.excerpt,
+                remote_meta=remote_meta,
+                ts=now,
+                session_id=session_id,
+            ),
+        ]
         if truncated:
-            self._emit_access_limitation(
+            events.append(self._build_access_limitation(
                 url=url,
                 reason="Content truncated due to byte limit",
                 limit_type="max_bytes",
                 limit_value=max_bytes,
                 current_value=content_length,
+                ts=now,
                 session_id=session_id,
-            )
+            ))
+        self.writer.append_many(events)
 
         return {
             "status": "success",
@@ -262,30 +271,11 @@ class WebEye:
             "truncated": truncated,
         }
 
-    def _extract_text_excerpt(
-        self,
-        content: bytes,
-        content_type: str,
-        max_length: int = 500,
-    ) -> str:
-        """Extract text excerpt from content."""
-        try:
-            # Try UTF-8 first
-            text = content.decode("utf-8", errors="replace")
-        except Exception:
-            text = content.decode("latin-1", errors="replace")
-
-        # Clean and truncate
-        text = " ".join(text.split())[:max_length]
-        if len(text) == max_length:
-            text = text[:max_length - 3] + "..."
-
-        return text
-
     def _emit_remote_lookup_declined(
         self,
         url: str,
         reason: str,
+        ts: float,
         session_id: Optional[str] = None,
     ) -> str:
         """Emit REMOTE_LOOKUP_DECLINED event."""
@@ -294,8 +284,8 @@ class WebEye:
         event = {
             "event_id": event_id,
             "event_type": "REMOTE_LOOKUP_DECLINED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": None,
             "confidence": 1.0,
             "evidence_refs": [],
@@ -312,23 +302,22 @@ class WebEye:
         self.writer.append(event)
         return event_id
 
-    def _emit_artifact_seen(
+    def _build_artifact_seen(
         self,
         artifact_id: str,
         url: str,
         size: int,
         content_type: str,
         remote_meta: dict,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit ARTIFACT_SEEN event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build ARTIFACT_SEEN event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "ARTIFACT_SEEN",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 0.9 * remote_meta.get("source_reliability", 0.5),
             "evidence_refs": [],
@@ -345,30 +334,28 @@ class WebEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_fingerprint_computed(
+    def _build_fingerprint_computed(
         self,
         artifact_id: str,
         content_hash: str,
         size_bytes: int,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit FINGERPRINT_COMPUTED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build FINGERPRINT_COMPUTED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "FINGERPRINT_COMPUTED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 1.0,
             "evidence_refs": [],
             "payload": {
                 "content_hash": content_hash,
-                "hash_algorithm": "sha256",
+                "hash_algorithm": self._hasher.name,
                 "size_bytes": size_bytes,
             },
         }
@@ -376,10 +363,9 @@ class WebEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_extraction_performed(
+    def _build_extraction_performed(
         self,
         artifact_id: str,
         url: str,
@@ -387,16 +373,15 @@ class WebEye:
         content_type: str,
         text_excerpt: str,
         remote_meta: dict,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit EXTRACTION_PERFORMED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build EXTRACTION_PERFORMED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "EXTRACTION_PERFORMED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": artifact_id,
             "confidence": 0.8,
             "evidence_refs": [],
@@ -415,26 +400,24 @@ class WebEye:
         if session_id:
             event["session_id"] = session_id
 
-        self.writer.append(event)
-        return event_id
+        return event
 
-    def _emit_access_limitation(
+    def _build_access_limitation(
         self,
         url: str,
         reason: str,
         limit_type: str,
         limit_value: float,
         current_value: float,
+        ts: float,
         session_id: Optional[str] = None,
-    ) -> str:
-        """Emit ACCESS_LIMITATION_NOTED event."""
-        event_id = self._make_event_id()
-
+    ) -> dict:
+        """Build ACCESS_LIMITATION_NOTED event."""
         event = {
-            "event_id": event_id,
+            "event_id": self._make_event_id(),
             "event_type": "ACCESS_LIMITATION_NOTED",
-            "ts": time.time(),
-            "actor": {"module": self.module_name},
+            "ts": ts,
+            "actor": self._actor,
             "artifact_id": None,
             "confidence": 1.0,
             "evidence_refs": [],
@@ -451,5 +434,27 @@ class WebEye:
         if session_id:
             event["session_id"] = session_id
 
+        return event
+
+    def _emit_access_limitation(
+        self,
+        url: str,
+        reason: str,
+        limit_type: str,
+        limit_value: float,
+        current_value: float,
+        ts: float,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """Emit ACCESS_LIMITATION_NOTED event."""
+        event = self._build_access_limitation(
+            url=url,
+            reason=reason,
+            limit_type=limit_type,
+            limit_value=limit_value,
+            current_value=current_value,
+            ts=ts,
+            session_id=session_id,
+        )
         self.writer.append(event)
-        return event_id
+        return event["event_id"]
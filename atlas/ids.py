@@ -0,0 +1,72 @@
+"""
+Atlas ID Pool
+
+Short random identifiers for events and sessions.
+
+Rules:
+- IDs are "<prefix>-<hex>", the same shape as uuid4().hex slices
+- Random bytes are drawn from os.urandom in large blocks
+- One urandom call serves thousands of IDs
+- Forked children start a fresh block
+"""
+
+import os
+import threading
+
+
+class IdPool:
+    """
+    Pool of random bytes sliced into hex IDs.
+
+    Each refill reads ``size`` bytes at once; ``next_id`` hands out
+    consecutive slices and refills when the block runs out.
+    Thread-safe.
+    """
+
+    def __init__(self, size: int = 4096 * 8):
+        """
+        Initialize ID pool.
+
+        Args:
+            size: Bytes of randomness fetched per refill
+        """
+        self._size = size
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def next_id(self, prefix: str, nbytes: int = 6) -> str:
+        """
+        Return a new ID of ``nbytes`` random bytes (2 * nbytes hex chars).
+
+        Args:
+            prefix: ID prefix, e.g. "sess"
+            nbytes: Random bytes in the ID
+        """
+        with self._lock:
+            pos = self._pos
+            end = pos + nbytes
+            if end > len(self._buf):
+                self._buf = os.urandom(max(self._size, nbytes))
+                pos, end = 0, nbytes
+            self._pos = end
+            return f"{prefix}-{self._buf[pos:end].hex()}"
+
+    def reset(self) -> None:
+        """Drop the current block so the next ID draws fresh bytes."""
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+
+# Process-wide pool; fills on first use
+_DEFAULT_POOL = IdPool()
+
+# A forked child must not hand out the parent's remaining block
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_DEFAULT_POOL.reset)
+
+
+def next_id(prefix: str, nbytes: int = 6) -> str:
+    """Return a new ID from the process-wide pool."""
+    return _DEFAULT_POOL.next_id(prefix, nbytes)
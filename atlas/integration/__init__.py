@@ -32,22 +32,16 @@ def export_api(
     """
     from atlas import __version__, __ATLAS_SCHEMA_VERSION__
     from atlas.ledger.reader import EventReader
-    from atlas.state.snapshots import read_snapshot, snapshot_path
+    from atlas.state.snapshots import get_snapshot, snapshot_path
 
     # Generate export ID
     state_id = f"export-{uuid.uuid4().hex[:12]}"
 
-    # Read artifacts from snapshot
-    snap_path = snapshot_path(state_dir)
-    artifacts = {}
-    if snap_path.exists():
-        artifacts = read_snapshot(snap_path)
+    # Read artifacts from snapshot (cached while the file is unchanged)
+    artifacts = get_snapshot(snapshot_path(state_dir)) or {}
 
     # Read relations snapshot if it exists
-    relations_path = snapshot_path(state_dir, name="relations")
-    relations = {}
-    if relations_path.exists():
-        relations = read_snapshot(relations_path)
+    relations = get_snapshot(snapshot_path(state_dir, name="relations")) or {}
 
     # Ledger stats
     reader = EventReader(ledger_dir=ledger_dir)
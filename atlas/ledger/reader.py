@@ -1,12 +1,26 @@
 import json
 from pathlib import Path
+from typing import Iterator
+
+# Bound decode of a shared decoder; skips json.loads' per-call dispatch
+_decode = json.JSONDecoder().decode
+
+# Ledger files are read through a large buffer.
+_BUFFER_SIZE = 1 << 20
+
 
 class EventReader:
     def __init__(self, ledger_dir="atlas/ledger/events"):
         self.ledger_dir = Path(ledger_dir)
 
-    def read_all(self):
+    def read_lines(self) -> Iterator[str]:
+        """Yield raw JSONL lines from all ledger files, oldest first."""
         for file in sorted(self.ledger_dir.glob("*.jsonl")):
-            with open(file, encoding="utf-8") as f:
+            with open(file, encoding="utf-8", buffering=_BUFFER_SIZE) as f:
                 for line in f:
-                    yield json.loads(line)
+                    if not line.isspace():
+                        yield line
+
+    def read_all(self) -> Iterator[dict]:
+        """Yield every ledger event, decoded, oldest first."""
+        return map(_decode, self.read_lines())
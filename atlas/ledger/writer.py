@@ -7,11 +7,18 @@ Append-only event log writer with fsync for durability.
 import json
 import os
 import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
 
 from atlas.ledger.validator import validate_strict
 
+# Shared encoder: json.dumps() builds a new JSONEncoder on every call
+# whenever a non-default option such as ensure_ascii is passed.
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class EventWriter:
     """
@@ -22,6 +29,7 @@ class EventWriter:
     - fsync after every write for durability
     - Thread-safe with locking
     - Optional strict validation
+    - Inside commit_group(), writes are grouped under one fsync
     """
 
     def __init__(
@@ -41,17 +49,21 @@ class EventWriter:
         self.strict = strict
         self._lock = threading.Lock()
 
+        # Active commit group (see commit_group)
+        self._group: Optional[list[str]] = None
+        self._group_events = 0
+        self._group_max_events = 0
+        self._group_max_delay_ns = 0
+        self._group_started_ns = 0
+
     def _event_file(self) -> Path:
         """Get current date's event file path."""
         date = datetime.utcnow().strftime("%Y-%m-%d")
         return self.ledger_dir / f"{date}.jsonl"
 
-    def append(self, event: dict) -> None:
+    def _serialize(self, event: dict) -> str:
         """
-        Append event to ledger.
-
-        Args:
-            event: Event dictionary with envelope fields
+        Validate event and serialize it as one JSON line.
 
         Raises:
             ValueError: If event is invalid
@@ -69,12 +81,134 @@ class EventWriter:
                 )
                 raise ValueError(f"Event validation failed: {errors}")
 
-        line = json.dumps(event, ensure_ascii=False)
+        return _ENCODER.encode(event) + "\n"
+
+    def _write_locked(self, data: str) -> None:
+        """Append serialized lines to today's file and fsync (lock held)."""
+        path = self._event_file()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _flush_group_locked(self) -> None:
+        """Write out the active commit group (lock held)."""
+        if self._group:
+            self._write_locked("".join(self._group))
+            self._group.clear()
+        self._group_events = 0
+        self._group_started_ns = time.monotonic_ns()
+
+    def _write(self, data: str, count: int = 1) -> None:
+        """Write serialized lines now, or queue them in the commit group."""
+        with self._lock:
+            group = self._group
+            if group is None:
+                self._write_locked(data)
+                return
+
+            group.append(data)
+            self._group_events += count
+            if (
+                self._group_events >= self._group_max_events
+                or time.monotonic_ns() - self._group_started_ns
+                >= self._group_max_delay_ns
+            ):
+                self._flush_group_locked()
+
+    @contextmanager
+    def commit_group(
+        self,
+        max_events: int = 1024,
+        max_delay_ms: float = 1000.0,
+    ) -> Iterator["EventWriter"]:
+        """
+        Group writes so many events share one write and one fsync.
+
+        Inside the block, append()/append_many() queue their lines.
+        The group is written out when it holds max_events events, when
+        a write arrives more than max_delay_ms after the last flush,
+        and when the block exits. Until then queued events are not
+        durable.
 
+        Args:
+            max_events: Flush once this many events are queued
+            max_delay_ms: Flush on the first write after this delay
+
+        Raises:
+            RuntimeError: If a commit group is already active
+        """
         with self._lock:
-            path = self._event_file()
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-                f.flush()
-                os.fsync(f.fileno())
+            if self._group is not None:
+                raise RuntimeError("Commit group already active")
+            self._group = []
+            self._group_events = 0
+            self._group_max_events = max_events
+            self._group_max_delay_ns = int(max_delay_ms * 1_000_000)
+            self._group_started_ns = time.monotonic_ns()
+
+        try:
+            yield self
+        finally:
+            with self._lock:
+                try:
+                    self._flush_group_locked()
+                finally:
+                    self._group = None
+
+    def append(self, event: dict) -> None:
+        """
+        Append event to ledger.
+
+        Args:
+            event: Event dictionary with envelope fields
 
+        Raises:
+            ValueError: If event is invalid
+        """
+        self._write(self._serialize(event))
+
+    def append_many(self, events: Iterable[dict]) -> int:
+        """
+        Append several events with a single write and fsync.
+
+        All events are validated before anything is written, so an
+        invalid event leaves the ledger untouched.
+
+        Args:
+            events: Event dictionaries with envelope fields
+
+        Returns:
+            Number of events written
+
+        Raises:
+            ValueError: If any event is invalid
+        """
+        lines = [self._serialize(event) for event in events]
+        if lines:
+            self._write("".join(lines), len(lines))
+        return len(lines)
+
+    def append_lines(self, lines: Sequence[str]) -> int:
+        """
+        Append already-serialized events with a single write and fsync.
+
+        For producers that format a fixed event shape themselves. Each
+        line must be one JSON event envelope ending in a newline, in the
+        same encoding append() would produce. Lines are not validated,
+        so strict writers refuse them.
+
+        Args:
+            lines: Serialized event lines
+
+        Returns:
+            Number of events written
+
+        Raises:
+            ValueError: If the writer is strict
+        """
+        if self.strict:
+            raise ValueError("Strict writer requires event dicts")
+        if lines:
+            self._write("".join(lines), len(lines))
+        return len(lines)
@@ -8,9 +8,10 @@ Never touches ledger - only moves cache blobs.
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -163,26 +164,32 @@ class Archive:
 
     def archive_batch(
         self,
-        paths: list[str],
+        paths: Iterable[str],
         session_id: Optional[str] = None,
+        workers: int = 1,
     ) -> list[ArchiveResult]:
         """
         Archive multiple files.
 
+        With workers > 1 the moves run on a thread pool; results keep
+        the order of paths.
+
         Args:
-            paths: List of file paths to archive
+            paths: File paths to archive
             session_id: Optional session ID
+            workers: Number of threads moving files
 
         Returns:
             List of ArchiveResults
         """
-        results = []
-
-        for path in paths:
-            result = self.archive_file(path, session_id)
-            results.append(result)
-
-        return results
+        if workers <= 1:
+            return [self.archive_file(path, session_id) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda path: self.archive_file(path, session_id),
+                paths,
+            ))
 
     def get_archive_stats(self) -> dict:
         """Get statistics about archived files."""
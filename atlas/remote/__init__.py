@@ -4,6 +4,7 @@ Atlas Remote Module
 Disciplined internet access for remote artifacts.
 """
 
+from atlas.remote.connections import ConnectionPool
 from atlas.remote.policy import (
     RemotePolicy,
     estimate_source_reliability,
@@ -11,6 +12,7 @@ from atlas.remote.policy import (
 )
 
 __all__ = [
+    "ConnectionPool",
     "RemotePolicy",
     "estimate_source_reliability",
     "estimate_volatility",
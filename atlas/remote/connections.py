@@ -0,0 +1,200 @@
+"""
+Atlas Remote Connections
+
+Keep-alive HTTP(S) connections reused across remote fetches.
+
+Rules:
+- Idle connections are pooled per (scheme, host, port)
+- A connection is reused only once its response was read to the end
+- Redirects are followed, as urlopen does
+- Failures raise urllib's HTTPError and URLError, as urlopen does
+- URLs that would go through a proxy are fetched with urlopen
+"""
+
+import http.client
+import io
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+# Idle connections kept per host.
+MAX_IDLE_PER_HOST = 16
+
+# Redirects followed per request, as urllib's HTTPRedirectHandler.
+MAX_REDIRECTS = 10
+
+# Error bodies up to this size are drained so the connection survives.
+MAX_DRAIN_BYTES = 64 * 1024
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+_ConnKey = tuple[str, str, Optional[int]]
+
+
+class ConnectionPool:
+    """
+    Pool of keep-alive HTTP(S) connections.
+
+    urlopen opens a new TCP (and TLS) connection per request; fetches
+    through a pool pay for that once per host. Thread-safe: a
+    connection serves one request at a time and idle ones are shared.
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        """
+        Initialize connection pool.
+
+        Args:
+            max_idle_per_host: Idle connections kept per host
+        """
+        self._max_idle = max_idle_per_host
+        self._idle: dict[_ConnKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._proxies = getproxies()
+
+    @contextmanager
+    def open(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        GET url and yield the response, like urlopen.
+
+        Raises:
+            HTTPError: On an error status
+            URLError: If the server cannot be reached
+        """
+        parts = urlsplit(url)
+        if parts.scheme in self._proxies and not proxy_bypass(
+            parts.hostname or ""
+        ):
+            with urlopen(Request(url, headers=headers), timeout=timeout) as r:
+                yield r
+            return
+
+        for _ in range(MAX_REDIRECTS + 1):
+            key, conn, response = self._request(url, headers, timeout)
+            status = response.status
+
+            location = response.getheader("Location")
+            if status in _REDIRECT_CODES and location:
+                self._drain(key, conn, response)
+                url = urljoin(url, location)
+                continue
+
+            if status >= 400:
+                body = self._drain(key, conn, response)
+                raise HTTPError(
+                    url, status, response.reason, response.headers,
+                    io.BytesIO(body) if body is not None else None,
+                )
+
+            try:
+                yield response
+            finally:
+                self._release(key, conn, response)
+            return
+
+        raise HTTPError(
+            url, status, "Too many redirects", response.headers, None,
+        )
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _request(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[_ConnKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send one GET on a pooled connection and read the status line."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise URLError(f"unknown url type: {scheme}")
+        if not parts.hostname:
+            raise URLError("no host given")
+
+        key = (scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        conn = self._acquire(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn_class = (
+                    http.client.HTTPSConnection if scheme == "https"
+                    else http.client.HTTPConnection
+                )
+                conn = conn_class(parts.hostname, parts.port, timeout=timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+
+            try:
+                conn.request("GET", path, headers=headers)
+                return key, conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError) as e:
+                conn.close()
+                if not reused:
+                    raise URLError(e)
+                # The server dropped the idle connection; retry fresh
+                conn, reused = None, False
+            except OSError as e:
+                conn.close()
+                raise URLError(e)
+            except BaseException:
+                conn.close()
+                raise
+
+    def _acquire(self, key: _ConnKey) -> Optional[http.client.HTTPConnection]:
+        """Take an idle connection for key, if there is one."""
+        with self._lock:
+            conns = self._idle.get(key)
+            return conns.pop() if conns else None
+
+    def _release(
+        self,
+        key: _ConnKey,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        """Return conn to the pool if its response was fully read."""
+        if response.isclosed() and not response.will_close:
+            with self._lock:
+                conns = self._idle.setdefault(key, [])
+                if len(conns) < self._max_idle:
+                    conns.append(conn)
+                    return
+        conn.close()
+
+    def _drain(
+        self,
+        key: _ConnKey,
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> Optional[bytes]:
+        """Read a small unwanted body and release conn; else close it."""
+        body = None
+        length = response.length
+        if length is not None and length <= MAX_DRAIN_BYTES:
+            try:
+                body = response.read()
+            except OSError:
+                pass
+        self._release(key, conn, response)
+        return body
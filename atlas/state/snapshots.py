@@ -9,7 +9,18 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
+
+# Shared codec objects; json.dumps/json.loads rebuild them per call
+# when options are passed.
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_decode = json.JSONDecoder().decode
+
+# Snapshot files are read and written through a large buffer.
+_BUFFER_SIZE = 1 << 20
+
+# Parsed snapshots keyed by path, tagged with (st_mtime_ns, st_size)
+_SNAPSHOT_CACHE: dict[Path, tuple[tuple[int, int], dict[str, dict]]] = {}
 
 
 def write_snapshot(
@@ -35,8 +46,6 @@ def write_snapshot(
     # Get directory for temp file (same filesystem for atomic rename)
     dir_path = path.parent
 
-    count = 0
-
     # Write to temp file first
     fd, tmp_path = tempfile.mkstemp(
         suffix=".tmp",
@@ -45,11 +54,10 @@ def write_snapshot(
     )
 
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            for artifact_id, state in artifacts.items():
-                line = json.dumps(state, ensure_ascii=False)
-                f.write(line + "\n")
-                count += 1
+        encode = _ENCODER.encode
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            f.writelines(encode(state) + "\n" for state in artifacts.values())
+            count = len(artifacts)
             f.flush()
             os.fsync(f.fileno())
 
@@ -77,29 +85,43 @@ def read_snapshot(path: str | Path) -> dict[str, dict]:
     Returns:
         Dict mapping artifact_id to artifact state
     """
-    path = Path(path)
+    return {
+        state["artifact_id"]: state
+        for state in iter_snapshot(path)
+    }
 
-    if not path.exists():
-        return {}
 
-    artifacts: dict[str, dict] = {}
+def get_snapshot(path: str | Path) -> Optional[dict[str, dict]]:
+    """
+    Read a snapshot, reusing the last parse if the file is unchanged.
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    The file is stat'ed first; when its mtime and size match the cached
+    parse, the cached artifacts are returned without reading the file.
+    The returned dict is a fresh copy, but the state dicts inside it are
+    shared with the cache and must be treated as read-only.
 
-            try:
-                state = json.loads(line)
-                artifact_id = state.get("artifact_id")
-                if artifact_id:
-                    artifacts[artifact_id] = state
-            except json.JSONDecodeError:
-                # Skip malformed lines
-                continue
+    Args:
+        path: Source file path
+
+    Returns:
+        Dict mapping artifact_id to artifact state, or None if the
+        snapshot does not exist
+    """
+    path = Path(path)
 
-    return artifacts
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _SNAPSHOT_CACHE.pop(path, None)
+        return None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _SNAPSHOT_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        cached = (key, read_snapshot(path))
+        _SNAPSHOT_CACHE[path] = cached
+
+    return dict(cached[1])
 
 
 def iter_snapshot(path: str | Path) -> Iterable[dict]:
@@ -119,19 +141,18 @@ def iter_snapshot(path: str | Path) -> Iterable[dict]:
     if not path.exists():
         return
 
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
+            # The decoder skips surrounding whitespace; blank and
+            # malformed lines both raise and are skipped.
             try:
-                state = json.loads(line)
-                if state.get("artifact_id"):
-                    yield state
+                state = _decode(line)
             except json.JSONDecodeError:
                 continue
 
+            if state.get("artifact_id"):
+                yield state
+
 
 def snapshot_path(state_dir: str | Path, name: str = "artifacts") -> Path:
     """
@@ -0,0 +1,56 @@
+"""
+Tests for the cache Archive.
+
+Tests archive moves including:
+- Batch moves in order
+- Threaded batch moves
+- Emitted FILE_ARCHIVED events
+"""
+
+import json
+
+from atlas.ledger.writer import EventWriter
+from atlas.maintenance.archive import Archive
+
+
+class TestArchiveBatch:
+    """Test Archive.archive_batch."""
+
+    def _make_cache(self, root, count):
+        cache = root / "cache"
+        (cache / "sub").mkdir(parents=True)
+        paths = []
+        for i in range(count):
+            path = cache / "sub" / f"blob{i}.bin"
+            path.write_bytes(b"x" * i)
+            paths.append(str(path))
+        return cache, paths
+
+    def test_batch_moves_in_order(self, tmp_path):
+        """Test serial batch returns one result per path, in order."""
+        cache, paths = self._make_cache(tmp_path, 3)
+        store = Archive(cache_dir=str(cache))
+
+        results = store.archive_batch(paths + [str(cache / "missing")])
+
+        assert [r.source_path for r in results[:3]] == paths
+        assert all(r.success for r in results[:3])
+        assert not results[3].success
+        assert len(list((cache / "archive").rglob("*.bin"))) == 3
+
+    def test_threaded_batch(self, tmp_path):
+        """Test threaded batch moves every file and logs each move."""
+        cache, paths = self._make_cache(tmp_path, 20)
+        writer = EventWriter(ledger_dir=str(tmp_path / "ledger"))
+        store = Archive(cache_dir=str(cache), writer=writer)
+
+        with writer.commit_group():
+            results = store.archive_batch(paths, workers=4)
+
+        assert [r.source_path for r in results] == paths
+        assert [r.size_bytes for r in results] == list(range(20))
+        assert all(r.success for r in results)
+
+        lines = next(writer.ledger_dir.glob("*.jsonl")).read_text()
+        events = [json.loads(line) for line in lines.splitlines()]
+        assert sorted(e["payload"]["source_path"] for e in events) == sorted(paths)
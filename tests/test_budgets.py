@@ -0,0 +1,314 @@
+"""
+Tests for the Budget system.
+
+Tests budget accounting including:
+- Limit creation and consumption
+- Exhaustion detection
+- Guard behavior
+"""
+
+import pickle
+
+from atlas.budgets import (
+    Budget,
+    BudgetGuard,
+    BudgetLimit,
+    BudgetPresets,
+    BudgetType,
+)
+
+
+class TestBudget:
+    """Test Budget accounting."""
+
+    def test_budget_types_are_contiguous_ints(self):
+        """Test budget types double as array indices."""
+        assert [int(bt) for bt in BudgetType] == list(range(len(BudgetType)))
+        assert BudgetType.TIME == 0
+        assert BudgetType.ITEMS.name == "ITEMS"
+
+    def test_create_sets_only_requested_limits(self):
+        """Test create activates only the given budgets."""
+        budget = Budget.create(files_limit=10, bytes_limit=100)
+
+        assert set(budget.limits) == {
+            BudgetType.BYTES_READ,
+            BudgetType.FILES_SCANNED,
+        }
+        assert budget.limits[BudgetType.FILES_SCANNED].limit == 10
+
+    def test_get_limit(self):
+        """Test get_limit builds a record only for active budgets."""
+        budget = Budget.create(files_limit=10)
+        budget.consume(BudgetType.FILES_SCANNED, 4)
+
+        assert budget.get_limit(BudgetType.FILES_SCANNED) == BudgetLimit(
+            BudgetType.FILES_SCANNED, 10, consumed=4,
+        )
+        assert budget.get_limit(BudgetType.ITEMS) is None
+
+    def test_consume_within_and_over_limit(self):
+        """Test consume reports whether usage stays within the limit."""
+        budget = Budget.create(files_limit=2)
+
+        assert budget.consume(BudgetType.FILES_SCANNED, 1)
+        assert budget.consume(BudgetType.FILES_SCANNED, 1)
+        assert not budget.consume(BudgetType.FILES_SCANNED, 1)
+        assert budget.limits[BudgetType.FILES_SCANNED].consumed == 3
+
+    def test_unlimited_budget_always_within(self):
+        """Test budgets without a limit never block."""
+        budget = Budget.create(files_limit=2)
+
+        assert budget.consume(BudgetType.ITEMS, 1_000_000)
+        assert budget.can_consume(BudgetType.ITEMS, 1_000_000)
+        assert budget.remaining(BudgetType.ITEMS) is None
+        assert not budget.any_exhausted
+
+    def test_exhaustion_detected(self):
+        """Test any_exhausted and exhausted_budgets."""
+        budget = Budget.create(files_limit=1, bytes_limit=100)
+
+        assert not budget.any_exhausted
+        budget.consume(BudgetType.FILES_SCANNED, 1)
+
+        assert budget.any_exhausted
+        assert budget.exhausted_budgets == [BudgetType.FILES_SCANNED]
+
+    def test_iter_exhausted(self):
+        """Test iter_exhausted yields lazily, time first."""
+        budget = Budget.create(time_seconds=0, items_limit=0)
+        budget.start()
+
+        exhausted = budget.iter_exhausted()
+
+        assert next(exhausted) == BudgetType.TIME
+        assert list(exhausted) == [BudgetType.ITEMS]
+
+    def test_negative_consume_clears_exhaustion(self):
+        """Test returning budget un-exhausts it."""
+        budget = Budget.create(items_limit=2)
+        budget.consume(BudgetType.ITEMS, 2)
+        assert budget.any_exhausted
+
+        assert budget.consume(BudgetType.ITEMS, -1)
+        assert not budget.any_exhausted
+        assert budget.exhausted_budgets == []
+
+    def test_zero_limit_is_exhausted(self):
+        """Test a zero limit is exhausted before any consumption."""
+        budget = Budget.create(files_limit=0)
+
+        assert budget.any_exhausted
+        assert budget.exhausted_budgets == [BudgetType.FILES_SCANNED]
+
+    def test_time_budget(self):
+        """Test time budget exhaustion and remaining."""
+        budget = Budget.create(time_seconds=0)
+        budget.start()
+
+        assert budget.any_exhausted
+        assert BudgetType.TIME in budget.exhausted_budgets
+
+        budget = Budget.create(time_seconds=3600)
+        budget.start()
+
+        assert not budget.any_exhausted
+        assert 0 < budget.remaining(BudgetType.TIME) <= 3600
+
+    def test_start_stop_timestamps(self):
+        """Test elapsed time freezes once stopped."""
+        budget = Budget()
+        assert budget.elapsed_seconds == 0.0
+        assert budget.started_at is None
+
+        budget.start()
+        budget.stop()
+        elapsed = budget.elapsed_seconds
+
+        assert elapsed >= 0.0
+        assert budget.elapsed_seconds == elapsed
+        assert budget.ended_at >= budget.started_at
+
+    def test_consume_file(self):
+        """Test consume_file matches two separate consume calls."""
+        fused = Budget.create(files_limit=3, bytes_limit=100)
+        split = Budget.create(files_limit=3, bytes_limit=100)
+
+        for size in (40, 60, 10):
+            within = fused.consume_file(size)
+            assert within == (
+                split.consume(BudgetType.FILES_SCANNED, 1)
+                & split.consume(BudgetType.BYTES_READ, size)
+            )
+
+        assert fused.limits == split.limits
+        assert fused.exhausted_budgets == split.exhausted_budgets
+
+    def test_consume_batch(self):
+        """Test consume_batch updates several budgets at once."""
+        budget = Budget.create(files_limit=10, bytes_limit=1000, items_limit=5)
+
+        assert budget.consume_batch(files=4, bytes_=400, items=2)
+        assert not budget.any_exhausted
+        assert not budget.consume_batch(files=7)
+
+        assert budget.exhausted_budgets == [BudgetType.FILES_SCANNED]
+        assert budget.remaining(BudgetType.BYTES_READ) == 600
+
+    def test_consume_fast_paths(self):
+        """Test specialized consumers match the generic consume."""
+        fast = Budget.create(items_limit=2, api_calls=1)
+        generic = Budget.create(items_limit=2, api_calls=1)
+
+        for _ in range(3):
+            assert fast.consume_items_fast() == generic.consume(
+                BudgetType.ITEMS, 1,
+            )
+        assert fast.consume_api_fast() == generic.consume(BudgetType.API_CALLS, 1)
+
+        assert fast.limits == generic.limits
+        assert fast.exhausted_budgets == generic.exhausted_budgets
+
+    def test_can_consume(self):
+        """Test can_consume does not record usage."""
+        budget = Budget.create(bytes_limit=100)
+
+        assert budget.can_consume(BudgetType.BYTES_READ, 100)
+        assert not budget.can_consume(BudgetType.BYTES_READ, 101)
+        assert budget.remaining(BudgetType.BYTES_READ) == 100
+
+    def test_summary(self):
+        """Test summary reports each active budget."""
+        budget = Budget.create(files_limit=4, bytes_limit=100)
+        budget.consume(BudgetType.FILES_SCANNED, 1)
+
+        summary = budget.summary()
+
+        assert set(summary) == {"bytes_read", "files_scanned"}
+        assert summary["files_scanned"] == {
+            "limit": 4,
+            "consumed": 1,
+            "remaining": 3,
+            "utilization": 0.25,
+        }
+
+    def test_summary_arrays(self):
+        """Test raw summary arrays are indexed by budget type."""
+        budget = Budget.create(files_limit=4)
+        budget.consume(BudgetType.FILES_SCANNED, 1)
+
+        limit, consumed, remaining, utilization = budget.summary_arrays()
+
+        assert limit[BudgetType.FILES_SCANNED] == 4
+        assert consumed[BudgetType.FILES_SCANNED] == 1
+        assert remaining[BudgetType.FILES_SCANNED] == 3
+        assert utilization[BudgetType.FILES_SCANNED] == 0.25
+        assert limit[BudgetType.ITEMS] == float("inf")
+        assert utilization[BudgetType.ITEMS] == 0.0
+
+    def test_limit_utilization(self):
+        """Test BudgetLimit utilization, including a zero limit."""
+        assert BudgetLimit(BudgetType.ITEMS, 4, consumed=1).utilization == 0.25
+        assert BudgetLimit(BudgetType.ITEMS, 0).utilization == 1.0
+        assert BudgetLimit(BudgetType.ITEMS, float("inf"), 5).utilization == 0.0
+
+    def test_init_from_limits(self):
+        """Test a budget can be built from BudgetLimit records."""
+        budget = Budget(limits={
+            BudgetType.ITEMS: BudgetLimit(BudgetType.ITEMS, 5, consumed=5),
+        })
+
+        assert budget.exhausted_budgets == [BudgetType.ITEMS]
+
+    def test_presets(self):
+        """Test presets produce independent budgets."""
+        first = BudgetPresets.quick_scan()
+        second = BudgetPresets.quick_scan()
+        first.consume(BudgetType.FILES_SCANNED, 50)
+
+        assert second.limits[BudgetType.FILES_SCANNED].consumed == 0
+        assert BudgetPresets.quick_scan().limits == Budget.create(
+            time_seconds=30,
+            files_limit=100,
+            bytes_limit=10 * 1024 * 1024,
+            depth_limit=3,
+        ).limits
+        assert BudgetPresets.unlimited().limits == {}
+
+    def test_preset_is_unstarted(self):
+        """Test presets start with no timing or consumption state."""
+        budget = BudgetPresets.deep_analysis()
+
+        assert budget.started_at is None
+        assert budget.elapsed_seconds == 0.0
+        assert not budget.any_exhausted
+        assert budget.remaining(BudgetType.TIME) == 3600
+
+    def test_pickle_roundtrip(self):
+        """Test slotted budgets survive pickling."""
+        budget = BudgetPresets.standard()
+        budget.consume(BudgetType.FILES_SCANNED, 1000)
+
+        restored = pickle.loads(pickle.dumps(budget))
+
+        assert restored.limits == budget.limits
+        assert restored.exhausted_budgets == [BudgetType.FILES_SCANNED]
+
+
+class TestBudgetGuard:
+    """Test BudgetGuard behavior."""
+
+    def test_consume_file(self):
+        """Test consume_file counts files and bytes."""
+        budget = Budget.create(files_limit=2, bytes_limit=100)
+
+        with BudgetGuard(budget) as guard:
+            assert guard.consume_file(40)
+            assert guard.can_continue()
+            assert not guard.consume_file(80)
+
+        assert budget.any_exhausted
+        assert budget.exhausted_budgets == [
+            BudgetType.BYTES_READ,
+            BudgetType.FILES_SCANNED,
+        ]
+
+    def test_can_consume(self):
+        """Test the guard checks remaining budget without consuming."""
+        budget = Budget.create(bytes_limit=100)
+        guard = BudgetGuard(budget)
+
+        assert guard.can_consume(BudgetType.BYTES_READ, 100)
+        assert not guard.can_consume(BudgetType.BYTES_READ, 101)
+        assert budget.remaining(BudgetType.BYTES_READ) == 100
+
+    def test_can_continue_samples_clock(self):
+        """Test an expired time budget stops the guard within 64 calls."""
+        budget = Budget.create(time_seconds=0)
+
+        with BudgetGuard(budget) as guard:
+            calls = 0
+            while guard.can_continue():
+                calls += 1
+                assert calls < 64
+
+    def test_at_depth(self):
+        """Test depth checks against the depth limit."""
+        guard = BudgetGuard(Budget.create(depth_limit=2))
+
+        assert guard.at_depth(2)
+        assert not guard.at_depth(3)
+        assert BudgetGuard(Budget()).at_depth(1000)
+
+    def test_summary(self):
+        """Test guard summary lists exhausted budgets by name."""
+        budget = Budget.create(items_limit=1)
+
+        with BudgetGuard(budget) as guard:
+            guard.consume_item()
+            summary = guard.summary
+
+        assert summary["exhausted"] is True
+        assert summary["exhausted_types"] == ["ITEMS"]
+        assert summary["budgets"]["items"]["consumed"] == 1
@@ -0,0 +1,150 @@
+"""
+Tests for the CLI entry point.
+
+Tests CLI wiring including:
+- Each command defined exactly once
+- Every subcommand reachable from main()
+- serve dispatching commands from stdin
+- remote-scan keeping piped stdout valid JSONL
+"""
+
+import ast
+import inspect
+import io
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from atlas import cli
+
+
+class TestCli:
+    """Test CLI module structure and dispatch."""
+
+    def test_functions_defined_once(self):
+        """Test no top-level function is redefined in cli.py."""
+        tree = ast.parse(inspect.getsource(cli))
+        names = [
+            node.name for node in tree.body
+            if isinstance(node, ast.FunctionDef)
+        ]
+
+        assert len(names) == len(set(names))
+
+    @pytest.mark.parametrize("command", sorted(cli._COMMAND_PARSERS))
+    def test_subcommand_help(self, command, capsys):
+        """Test every subcommand is registered and parses --help."""
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main([command, "--help"])
+
+        assert excinfo.value.code == 0
+        assert f"atlas {command}" in capsys.readouterr().out
+
+    def test_version(self, capsys):
+        """Test version dispatches to cmd_version."""
+        assert cli.main(["version"]) == 0
+        assert capsys.readouterr().out.startswith("atlas-core ")
+
+    def test_parser_cached_per_command(self):
+        """Test parsers are built once per selected command."""
+        assert cli._build_parser("version") is cli._build_parser("version")
+        assert cli._build_parser("version") is not cli._build_parser(None)
+
+    def test_serve_runs_commands_from_stdin(self, tmp_path, monkeypatch, capsys):
+        """Test serve dispatches each JSON line and reports exit codes."""
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "a.txt").write_text("a")
+        lines = [
+            '["version"]',
+            json.dumps(["scan", str(tmp_path / "data")]),
+            "not json",
+            '["serve"]',
+        ]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+
+        code = cli.main(["--ledger-dir", str(tmp_path / "ledger"), "serve"])
+
+        captured = capsys.readouterr()
+        # stdout carries nothing but result lines
+        results = [json.loads(line) for line in captured.out.splitlines()]
+        assert code == 0
+        assert len(results) == len(lines)
+        assert "[atlas]" in captured.err
+        assert results[0] == {"command": "version", "exit_code": 0}
+        assert results[1] == {"command": "scan", "exit_code": 0}
+        assert "error" in results[2]
+        assert results[3]["error"] == "Nested serve"
+        assert len(list((tmp_path / "ledger").glob("*.jsonl"))) == 1
+
+    def test_piped_remote_scan_is_jsonl(self, tmp_path, capsys):
+        """Test piped remote-scan output is JSON only; progress is stderr."""
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, format, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/page"
+        try:
+            code = cli.main([
+                "--ledger-dir", str(tmp_path / "ledger"),
+                "remote-scan", url, "--allow-remote",
+            ])
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+        captured = capsys.readouterr()
+        results = [json.loads(line) for line in captured.out.splitlines()]
+        assert code == 0
+        assert [(r["url"], r["status"]) for r in results] == [(url, "success")]
+        assert "[atlas] Remote scan complete" in captured.err
+
+    def test_serve_reports_command_exit(self, tmp_path, monkeypatch, capsys):
+        """Test a command calling sys.exit gets a result; serving goes on."""
+        def exiting(args):
+            sys.exit(3)
+
+        monkeypatch.setattr(cli, "cmd_version", exiting)
+        monkeypatch.setattr("sys.stdin", io.StringIO('["version"]\n["scan", "--help"]\n'))
+        cli._build_parser.cache_clear()
+        try:
+            code = cli.main(["--ledger-dir", str(tmp_path / "ledger"), "serve"])
+        finally:
+            cli._build_parser.cache_clear()
+
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert code == 0
+        assert results == [
+            {"command": "version", "exit_code": 3},
+            {"command": "scan", "exit_code": 0},
+        ]
+
+    def test_rebuild_skips_when_snapshot_current(self, tmp_path, capsys):
+        """Test rebuild is skipped until the ledger changes or --force."""
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "a.txt").write_text("a")
+        dirs = [
+            "--ledger-dir", str(tmp_path / "ledger"),
+            "--state-dir", str(tmp_path / "state"),
+        ]
+        cli.main(dirs + ["scan", str(tmp_path / "data")])
+
+        cli.main(dirs + ["rebuild"])
+        assert "Rebuild complete" in capsys.readouterr().out
+
+        cli.main(dirs + ["rebuild"])
+        assert "Snapshot up-to-date" in capsys.readouterr().out
+
+        cli.main(dirs + ["rebuild", "--force"])
+        assert "Rebuild complete" in capsys.readouterr().out
@@ -0,0 +1,329 @@
+"""
+Tests for the confidence model.
+
+Tests confidence handling including:
+- Level mapping and assessments
+- Combination and decay helpers
+- Engine updates and emitted events
+"""
+
+import dataclasses
+import math
+import pickle
+import time
+from datetime import datetime
+
+import pytest
+
+from atlas.confidence import (
+    AmbiguityType,
+    ConfidenceAssessment,
+    ConfidenceBuilder,
+    ConfidenceEngine,
+    ConfidenceLevel,
+    EvidenceItem,
+    combine_confidence,
+    confidence_degraded_by_time,
+    confidence_from_inference,
+    confidence_from_observation,
+)
+from atlas.ledger.reader import EventReader
+from atlas.ledger.writer import EventWriter
+
+
+class TestConfidenceLevel:
+    """Test score to level mapping."""
+
+    def test_from_score_boundaries(self):
+        """Test each threshold belongs to the level above it."""
+        cases = {
+            0.0: ConfidenceLevel.SPECULATIVE,
+            0.2499: ConfidenceLevel.SPECULATIVE,
+            0.25: ConfidenceLevel.LOW,
+            0.5: ConfidenceLevel.MODERATE,
+            0.7499: ConfidenceLevel.MODERATE,
+            0.75: ConfidenceLevel.HIGH,
+            0.95: ConfidenceLevel.CERTAIN,
+            1.0: ConfidenceLevel.CERTAIN,
+        }
+
+        for score, level in cases.items():
+            assert ConfidenceLevel.from_score(score) is level
+
+
+class TestConfidenceAssessment:
+    """Test ConfidenceAssessment derived values."""
+
+    def test_ambiguity_lowers_effective_score(self):
+        """Test each ambiguity flag costs 0.1 and moves the level."""
+        assessment = ConfidenceAssessment(
+            score=0.8,
+            reasoning="test",
+            ambiguity_flags=(
+                AmbiguityType.INCOMPLETE_DATA,
+                AmbiguityType.CONFLICTING_EVIDENCE,
+            ),
+        )
+
+        assert abs(assessment.effective_score - 0.6) < 1e-9
+        assert assessment.level is ConfidenceLevel.MODERATE
+        assert not assessment.is_actionable
+        assert assessment.needs_review
+
+    def test_conflicting_evidence_needs_review(self):
+        """Test conflicting evidence forces review even at high scores."""
+        flags = (AmbiguityType.HEURISTIC_MATCH, AmbiguityType.CONFLICTING_EVIDENCE)
+
+        assert ConfidenceAssessment(1.0, "test", ambiguity_flags=flags).needs_review
+        assert not ConfidenceAssessment(
+            1.0, "test", ambiguity_flags=flags[:1],
+        ).needs_review
+        assert ConfidenceAssessment(0.49, "test").needs_review
+        assert len({flag.value for flag in AmbiguityType}) == len(AmbiguityType)
+
+    def test_derived_values_follow_replace(self):
+        """Test cached values are recomputed for replaced copies."""
+        assessment = ConfidenceAssessment(score=0.9, reasoning="test")
+        lowered = dataclasses.replace(assessment, score=0.3)
+
+        assert assessment.level is ConfidenceLevel.HIGH
+        assert lowered.effective_score == 0.3
+        assert lowered.level is ConfidenceLevel.LOW
+        assert assessment == ConfidenceAssessment(score=0.9, reasoning="test")
+        assert "_level" not in repr(assessment)
+
+    def test_assessed_at_built_lazily(self):
+        """Test factories stamp a float and expose it as a datetime."""
+        before = datetime.utcnow().replace(microsecond=0)
+        assessment = ConfidenceBuilder(0.6).build()
+
+        assert assessment._assessed_at is None
+        assert isinstance(assessment.assessed_at_ts, float)
+        assert assessment.assessed_at >= before
+        assert assessment.assessed_at is assessment.assessed_at
+
+        restored = pickle.loads(pickle.dumps(assessment))
+        assert restored.assessed_at == assessment.assessed_at
+
+    def test_assessed_at_explicit(self):
+        """Test an explicit datetime is kept and survives replace."""
+        stamp = datetime(2024, 1, 1)
+        assessment = ConfidenceAssessment(0.5, "test", assessed_at=stamp)
+
+        assert assessment.assessed_at is stamp
+        assert dataclasses.replace(assessment, score=0.6).assessed_at == stamp
+        assert assessment != ConfidenceAssessment(
+            0.5, "test", assessed_at=datetime(2025, 1, 1),
+        )
+        assert ConfidenceAssessment(0.5, "test").assessed_at is None
+
+    def test_slotted(self):
+        """Test assessments and evidence carry no instance dict."""
+        assessment = ConfidenceAssessment(0.5, "test")
+
+        assert not hasattr(assessment, "__dict__")
+        assert "__slots__" in vars(EvidenceItem)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            assessment.score = 0.9
+
+
+class TestConfidenceBuilder:
+    """Test ConfidenceBuilder assembly."""
+
+    def test_reasoning_in_call_order(self):
+        """Test reasons, boosts and penalties are joined in order."""
+        assessment = (
+            ConfidenceBuilder(0.5)
+            .with_reason("seen")
+            .boost(0.25, "hashed")
+            .penalize(0.05, "partial")
+            .build()
+        )
+
+        assert assessment.reasoning == "seen; +0.25: hashed; -0.05: partial"
+        assert abs(assessment.score - 0.7) < 1e-9
+        assert ConfidenceBuilder().build().reasoning == "No reasoning provided"
+
+
+class TestCalculations:
+    """Test confidence calculation helpers."""
+
+    def test_combine_confidence(self):
+        """Test combination is weighted by evidence count and score."""
+        strong = ConfidenceAssessment(0.8, "strong")
+        flagged = ConfidenceAssessment(
+            0.4, "weak", ambiguity_flags=(AmbiguityType.HEURISTIC_MATCH,),
+        )
+
+        combined = combine_confidence([strong, flagged])
+
+        assert abs(combined - (0.8 * 0.8 + 0.3 * 0.4) / 1.2) < 1e-9
+        assert combine_confidence([]) == 0.0
+        assert combine_confidence([ConfidenceAssessment(0.0, "none")]) == 0.0
+
+    def test_from_observation(self):
+        """Test observation scope, depth and hash each shape the result."""
+        full = confidence_from_observation("read-only", 2, True)
+        meta = confidence_from_observation("metadata-only", 0, False)
+
+        assert abs(full.score - 0.94) < 1e-9
+        assert full.reasoning == (
+            "Full read access; Extraction depth 2; Content verified by hash"
+        )
+        assert full.ambiguity_flags == ()
+        assert meta.score == 0.5
+        assert meta.ambiguity_flags == (AmbiguityType.INCOMPLETE_DATA,)
+
+        deep = confidence_from_observation("partial", 12, False)
+        assert abs(deep.score - 0.75) < 1e-9
+        assert deep.reasoning == "Partial access; Extraction depth 12"
+
+        again = confidence_from_observation("read-only", 2, True)
+        assert again is not full
+        assert again.score == full.score
+        assert again.reasoning is full.reasoning
+
+    def test_from_inference_flags(self):
+        """Test long inference chains are also flagged incomplete."""
+        short = confidence_from_inference(0.9, 2, 0)
+        long = confidence_from_inference(0.9, 3, 4)
+
+        assert short.ambiguity_flags == (AmbiguityType.INFERENCE_CHAIN,)
+        assert long.ambiguity_flags == (
+            AmbiguityType.INFERENCE_CHAIN,
+            AmbiguityType.INCOMPLETE_DATA,
+        )
+        assert abs(long.score - (0.9 * 0.85 ** 3 + 0.2)) < 1e-9
+
+    def test_degraded_by_time_half_lives(self):
+        """Test volatile data halves in a day, stable data in 30 days."""
+        original = ConfidenceAssessment(0.8, "seen")
+
+        volatile = confidence_degraded_by_time(original, 24, volatility=1.0)
+        stable = confidence_degraded_by_time(original, 720, volatility=0.0)
+
+        assert abs(volatile.score - 0.4) < 1e-9
+        assert abs(stable.score - 0.4) < 1e-9
+        assert AmbiguityType.STALE_OBSERVATION not in volatile.ambiguity_flags
+        assert AmbiguityType.STALE_OBSERVATION in stable.ambiguity_flags
+
+        again = confidence_degraded_by_time(stable, 48)
+        assert again.ambiguity_flags == stable.ambiguity_flags
+
+
+class TestConfidenceEngine:
+    """Test ConfidenceEngine updates."""
+
+    def test_reinforce_log_saturating(self):
+        """Test reinforcement grows with log(1 + recurrences), capped at 1."""
+        engine = ConfidenceEngine()
+
+        once, _ = engine.reinforce("a", 0.5, 1, [])
+        many, _ = engine.reinforce("a", 0.5, 99, [])
+        capped, _ = engine.reinforce("a", 0.999, 1000, [])
+
+        assert abs(once - (0.5 + 0.01 * math.log(2))) < 1e-12
+        assert abs(many - (0.5 + 0.01 * math.log(100))) < 1e-12
+        assert capped == 1.0
+
+    def test_decay_batch_matches_single(self, tmp_path):
+        """Test batch decay matches per-artifact decay and batches events."""
+        engine = ConfidenceEngine(EventWriter(tmp_path))
+        now = time.time()
+        ids = ["a", "b", "c"]
+        confidences = [0.9, 0.5, 0.8]
+        observed = [now - 3600 * 500, now - 1, now + 3600]
+
+        new, event_ids = engine.apply_freshness_decay_batch(
+            ids, confidences, observed, volatilities=0.5,
+        )
+
+        single = [
+            ConfidenceEngine().apply_freshness_decay(aid, c, ts, 0.5)[0]
+            for aid, c, ts in zip(ids, confidences, observed)
+        ]
+        assert abs(new[0] - single[0]) < 1e-9
+        assert new[1:] == [0.5, 0.8]
+        assert len(event_ids[0]) == len("conf-") + 16
+        assert event_ids[0].startswith("conf-")
+        assert event_ids[1:] == ["", ""]
+
+        events = list(EventReader(tmp_path).read_all())
+        assert [e["event_id"] for e in events] == [event_ids[0]]
+        assert events[0]["payload"]["new_confidence"] == new[0]
+        assert now <= events[0]["ts"] <= time.time()
+
+    def test_decay_batch_without_writer(self):
+        """Test batch decay computes values without a writer."""
+        engine = ConfidenceEngine()
+        now = time.time()
+
+        new, event_ids = engine.apply_freshness_decay_batch(
+            ["a", "b"], [0.9, 0.9], [now - 3600 * 24, now - 3600 * 24],
+            volatilities=[0.0, 1.0],
+        )
+
+        assert new[1] < new[0] < 0.9
+        assert event_ids == ["", ""]
+
+    def test_evolve_writes_steps_together(self, tmp_path):
+        """Test evolve_confidence writes all step events in one batch."""
+        writer = EventWriter(tmp_path)
+        calls = []
+        append_many = writer.append_many
+
+        def counting_append_many(events):
+            calls.append(len(events))
+            return append_many(events)
+
+        writer.append_many = counting_append_many
+        engine = ConfidenceEngine(writer)
+
+        confidence, event_ids = engine.evolve_confidence(
+            "a", 0.8, time.time() - 3600 * 100,
+            recurring_count=2, contradiction_strength=0.5,
+        )
+
+        events = list(EventReader(tmp_path).read_all())
+        assert calls == [3]
+        assert [e["event_id"] for e in events] == event_ids
+        assert events[-1]["confidence"] == confidence
+
+        engine.reinforce("a", confidence, 1, [])
+        assert len(list(EventReader(tmp_path).read_all())) == 4
+
+    def test_evolve_batch_matches_single(self, tmp_path):
+        """Test batch evolution matches evolve_confidence row by row."""
+        engine = ConfidenceEngine(EventWriter(tmp_path))
+        observed = time.time() - 3600 * 48
+        rows = [("a", 0.9, 0, 0.0), ("b", 0.6, 3, 0.0), ("c", 0.7, 1, 0.8)]
+
+        confidences, event_ids = engine.evolve_confidence_batch(
+            [r[0] for r in rows],
+            [r[1] for r in rows],
+            [observed] * len(rows),
+            recurring_counts=[r[2] for r in rows],
+            contradiction_strengths=[r[3] for r in rows],
+        )
+
+        for (aid, conf, rec, contra), batched, eids in zip(
+            rows, confidences, event_ids,
+        ):
+            single, single_ids = ConfidenceEngine().evolve_confidence(
+                aid, conf, observed, recurring_count=rec,
+                contradiction_strength=contra,
+            )
+            assert abs(batched - single) < 1e-9
+            assert len(eids) == 1 + (rec > 0) + (contra > 0)
+
+        events = list(EventReader(tmp_path).read_all())
+        assert [e["event_id"] for e in events] == sum(event_ids, [])
+
+    def test_evolve_fresh_observation_is_noop(self, tmp_path):
+        """Test a just-observed artifact with no other inputs is untouched."""
+        engine = ConfidenceEngine(EventWriter(tmp_path))
+
+        result = engine.evolve_confidence("a", 0.7, time.time() + 60)
+
+        assert result == (0.7, [])
+        assert list(EventReader(tmp_path).read_all()) == []
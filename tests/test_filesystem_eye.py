@@ -4,9 +4,18 @@ Tests for FilesystemEye budget enforcement.
 Tests that observation respects configured limits.
 """
 
+import hashlib
+import json
+import os
+from datetime import datetime
+from uuid import UUID
+
 import pytest
 
+from atlas import eyes
+from atlas.budgets import Budget
 from atlas.eyes.filesystem import FilesystemEye
+from atlas.ledger.events import EventType
 from atlas.ledger.writer import EventWriter
 
 
@@ -137,6 +146,157 @@ class TestFilesystemEyeBudget:
         # Should only see top-level files (file1.txt, file2.txt)
         assert result["files_seen"] == 2
 
+    def test_skips_own_ledger(self, temp_tree, monkeypatch):
+        """Test the ledger inside the scanned tree is never observed."""
+        monkeypatch.chdir(temp_tree)
+        writer = EventWriter(ledger_dir="ledger")
+        writer.append({"event_id": "e-1", "event_type": "TEST"})
+
+        result = FilesystemEye(writer).observe(
+            root=str(temp_tree), budget=SimpleBudget(),
+        )
+
+        assert result["files_seen"] == 4
+
+    def test_workers_match_serial_scan(self, temp_tree, tmp_path_factory):
+        """Test hashing on a thread pool emits the same events in order."""
+        def scan(workers):
+            writer = EventWriter(ledger_dir=str(tmp_path_factory.mktemp("ledger")))
+            result = FilesystemEye(writer).observe(
+                root=str(temp_tree),
+                budget=SimpleBudget(max_files=3),
+                workers=workers,
+            )
+            lines = next(writer.ledger_dir.glob("*.jsonl")).read_text()
+            events = [json.loads(line) for line in lines.splitlines()]
+            return result, [
+                (e["event_type"], e["artifact_id"], e["payload"].get("path"))
+                for e in events
+            ]
+
+        assert scan(workers=4) == scan(workers=1)
+
+    def test_event_ids(self, temp_tree, writer):
+        """Test event IDs keep the fs- prefix and 16 hex digits, unique."""
+        FilesystemEye(writer).observe(root=str(temp_tree), budget=SimpleBudget())
+
+        lines = next(writer.ledger_dir.glob("*.jsonl")).read_text().splitlines()
+        ids = [json.loads(line)["event_id"] for line in lines]
+        assert len(set(ids)) == len(ids) == 4
+        assert all(i.startswith("fs-") and len(i) == 19 for i in ids)
+
+    def test_hash_algorithm(self, temp_tree, tmp_path_factory):
+        """Test the content hash algorithm is configurable."""
+        def artifact_ids(**kwargs):
+            writer = EventWriter(ledger_dir=str(tmp_path_factory.mktemp("ledger")))
+            FilesystemEye(writer, **kwargs).observe(
+                root=str(temp_tree), budget=SimpleBudget(max_files=1),
+            )
+            lines = next(writer.ledger_dir.glob("*.jsonl")).read_text()
+            return {json.loads(line)["artifact_id"] for line in lines.splitlines()}
+
+        assert hashlib.sha256(b"x" * 100).hexdigest() in artifact_ids()
+        assert hashlib.blake2b(b"x" * 100).hexdigest() in artifact_ids(
+            hash_algorithm="blake2b",
+        )
+        with pytest.raises(ValueError):
+            FilesystemEye(None, hash_algorithm="no-such-hash")
+
+    @pytest.mark.parametrize("algorithm", ["shake_128", "shake_256"])
+    def test_variable_length_hash_rejected(self, algorithm):
+        """Test shake_* fails at construction, not on every file."""
+        with pytest.raises(ValueError):
+            FilesystemEye(None, hash_algorithm=algorithm)
+        with pytest.raises(ValueError):
+            eyes.FilesystemEye(hash_algorithm=algorithm)
+
+    def test_serialized_events_match_dicts(self, temp_tree, tmp_path_factory):
+        """Test preformatted ARTIFACT_SEEN lines match the dict encoding."""
+        (temp_tree / "caf\u00e9 \"q\".txt").write_bytes(b"y")
+
+        def ledger(raw_seen):
+            writer = EventWriter(ledger_dir=str(tmp_path_factory.mktemp("ledger")))
+            eye = FilesystemEye(writer)
+            eye._raw_seen = raw_seen
+            eye.observe(
+                root=str(temp_tree),
+                budget=SimpleBudget(max_files=4),
+                session_id="sess-1",
+            )
+            return next(writer.ledger_dir.glob("*.jsonl")).read_text()
+
+        raw, dicts = ledger(True), ledger(False)
+
+        def normalized(text):
+            events = [json.loads(line) for line in text.splitlines()]
+            for event in events:
+                del event["event_id"], event["ts"]
+            return events
+
+        assert len(raw.splitlines()) == 5
+        assert normalized(raw) == normalized(dicts)
+        for line in raw.splitlines():
+            assert json.dumps(json.loads(line), ensure_ascii=False) == line
+
+    def test_unreadable_entries_reported_once(self, temp_tree, writer):
+        """Test skipped entries are counted into one limitation event."""
+        for name in ("loop1", "loop2"):
+            (temp_tree / name).symlink_to(name)
+
+        result = FilesystemEye(writer).observe(
+            root=str(temp_tree), budget=SimpleBudget(),
+        )
+
+        assert result["files_seen"] == 4
+        assert result["entries_skipped"] == 2
+        lines = next(writer.ledger_dir.glob("*.jsonl")).read_text().splitlines()
+        last = json.loads(lines[-1])
+        assert last["event_type"] == "ACCESS_LIMITATION_NOTED"
+        assert last["payload"]["limit_type"] == "unreadable"
+        assert last["payload"]["current_value"] == 2
+
+    def test_background_writes_match_inline(self, temp_tree, tmp_path_factory):
+        """Test the background flusher writes the same events in order."""
+        def events(background_writes):
+            writer = EventWriter(ledger_dir=str(tmp_path_factory.mktemp("ledger")))
+            FilesystemEye(writer).observe(
+                root=str(temp_tree),
+                budget=SimpleBudget(max_files=3),
+                background_writes=background_writes,
+            )
+            lines = next(writer.ledger_dir.glob("*.jsonl")).read_text()
+            return [
+                (event["event_type"], event["payload"].get("path"))
+                for event in map(json.loads, lines.splitlines())
+            ]
+
+        assert events(True) == events(False)
+        assert events(True)[-1] == ("ACCESS_LIMITATION_NOTED", None)
+
+    def test_background_write_errors_raise(self, temp_tree, tmp_path):
+        """Test a writer error on the flush thread reaches the caller."""
+        # Strict validation rejects this eye's ARTIFACT_SEEN payloads
+        writer = EventWriter(ledger_dir=str(tmp_path / "ledger"), strict=True)
+
+        with pytest.raises(ValueError):
+            FilesystemEye(writer).observe(
+                root=str(temp_tree), budget=SimpleBudget(),
+            )
+
+    def test_time_budget(self, temp_tree, writer):
+        """Test an expired time budget stops before the first file."""
+        result = FilesystemEye(writer).observe(
+            root=str(temp_tree), budget=SimpleBudget(max_time_ms=0),
+        )
+
+        assert result["files_seen"] == 0
+        assert result["stopped_reason"] == "time_budget_exceeded"
+
+        lines = next(writer.ledger_dir.glob("*.jsonl")).read_text().splitlines()
+        payload = json.loads(lines[0])["payload"]
+        assert payload["limit_type"] == "max_time_ms"
+        assert payload["current_value"] >= 0
+
     def test_zero_budget_stops_immediately(self, temp_tree, writer):
         """Test zero budget stops immediately."""
         eye = FilesystemEye(writer)
@@ -174,3 +334,161 @@ class TestFilesystemEyeBudget:
 
         assert result["files_seen"] == 0
         assert result["bytes_accounted"] == 0
+
+
+class TestScanningFilesystemEye:
+    """Test the Eye-framework FilesystemEye fingerprints."""
+
+    def test_fingerprints_match_sha256(self, tmp_path):
+        """Test small, multi-chunk and empty files hash to their SHA-256."""
+        contents = {
+            "empty.bin": b"",
+            "small.bin": b"a" * 100,
+            "large.bin": bytes(range(256)) * 1024,  # Several read chunks
+        }
+        for name, data in contents.items():
+            (tmp_path / name).write_bytes(data)
+
+        result = eyes.FilesystemEye().scan(
+            str(tmp_path), Budget.create(files_limit=10),
+        )
+
+        hashes = {
+            obs.source_locator.rsplit("/", 1)[-1]: event.payload["content_hash"]
+            for obs in result.observations
+            for event in obs.events
+            if event.event_type == EventType.FINGERPRINT_COMPUTED
+        }
+        assert hashes == {
+            name: hashlib.sha256(data).hexdigest()
+            for name, data in contents.items()
+        }
+
+    @pytest.mark.parametrize("stat_size", [0, 10, 100_000, 1 << 20])
+    @pytest.mark.parametrize("actual_size", [0, 5_000, 300_000])
+    def test_hash_follows_file_not_stat(self, tmp_path, stat_size, actual_size):
+        """Test files that changed size since stat hash what is read."""
+        path = tmp_path / "changing.bin"
+        data = bytes(range(256)) * (actual_size // 256) + b"x" * (actual_size % 256)
+        path.write_bytes(data)
+
+        content_hash = eyes.FilesystemEye()._compute_hash(path, stat_size)
+
+        assert content_hash == hashlib.sha256(data).hexdigest()
+
+    @pytest.mark.parametrize("size", [3_000, 100_000])
+    def test_short_reads_hash_whole_file(self, tmp_path, monkeypatch, size):
+        """Test partial readv results do not truncate the hash."""
+        path = tmp_path / "slow.bin"
+        data = bytes(range(256)) * (size // 256)
+        path.write_bytes(data)
+        readv = os.readv
+        monkeypatch.setattr(
+            os, "readv", lambda fd, buffers: readv(fd, [buffers[0][:1000]]),
+        )
+
+        content_hash = eyes.FilesystemEye()._compute_hash(path, len(data))
+
+        assert content_hash == hashlib.sha256(data).hexdigest()
+
+    def test_artifact_ids_follow_content(self, tmp_path):
+        """Test hashed files get content-derived artifact IDs."""
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_bytes(b"same")
+
+        result = eyes.FilesystemEye().scan(
+            str(tmp_path), Budget.create(files_limit=10),
+        )
+
+        expected = UUID(hashlib.sha256(b"same").hexdigest()[:32])
+        assert [obs.artifact_id for obs in result.observations] == [
+            expected, expected,
+        ]
+        assert all(
+            event.artifact_refs == (expected,)
+            for obs in result.observations
+            for event in obs.events
+        )
+
+    def test_unread_files_get_distinct_ids(self, tmp_path):
+        """Test files over the byte budget get random artifact IDs."""
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_bytes(b"same")
+
+        result = eyes.FilesystemEye().scan(
+            str(tmp_path), Budget.create(files_limit=10, bytes_limit=1),
+        )
+
+        ids = {obs.artifact_id for obs in result.observations}
+        assert len(ids) == 2
+        assert UUID(hashlib.sha256(b"same").hexdigest()[:32]) not in ids
+
+    def test_skips_hidden_and_tooling_dirs(self, tmp_path):
+        """Test hidden entries and skip-listed trees are not observed."""
+        for rel in ("keep.txt", ".hidden.txt", "node_modules/dep.js",
+                    "__pycache__/mod.pyc", "src/main.py"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("x")
+
+        def observed(**kwargs):
+            result = eyes.FilesystemEye().scan(
+                str(tmp_path), Budget.create(files_limit=10), **kwargs,
+            )
+            return sorted(
+                obs.source_locator[len(str(tmp_path)) + 1:]
+                for obs in result.observations
+            )
+
+        assert observed() == ["keep.txt", "src/main.py"]
+        assert observed(skip_names=()) == [
+            "__pycache__/mod.pyc", "keep.txt", "node_modules/dep.js",
+            "src/main.py",
+        ]
+        assert len(observed(include_hidden=True)) == 5
+
+    def test_scan_timestamps(self, tmp_path):
+        """Test scan start and end stamps and their datetime views."""
+        before = datetime.utcnow().replace(microsecond=0)
+
+        result = eyes.FilesystemEye().scan(
+            str(tmp_path), Budget.create(files_limit=10),
+        )
+
+        assert result.ended_at_ns >= result.started_at_ns
+        assert before <= result.started_at <= result.ended_at
+        assert result.ended_at.tzinfo is None
+
+    def test_results_are_slotted(self, tmp_path):
+        """Test scan and observation results carry no instance dict."""
+        (tmp_path / "a.txt").write_text("a")
+
+        result = eyes.FilesystemEye().scan(
+            str(tmp_path), Budget.create(files_limit=10),
+        )
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.observations[0], "__dict__")
+
+    def test_deep_tree_does_not_recurse(self, tmp_path):
+        """Test trees deeper than the recursion limit scan without error."""
+        dirs = [tmp_path / "d"]
+        for _ in range(1199):
+            dirs.append(dirs[-1] / "d")
+        for d in dirs:
+            d.mkdir()
+        leaf = dirs[-1] / "leaf.txt"
+        leaf.write_text("x")
+
+        try:
+            result = eyes.FilesystemEye().scan(
+                str(tmp_path), Budget.create(files_limit=10),
+            )
+        finally:
+            # Removed here; recursive tmp_path cleanup cannot go this deep
+            leaf.unlink()
+            for d in reversed(dirs):
+                d.rmdir()
+
+        assert [obs.source_locator for obs in result.observations] == [
+            str(leaf),
+        ]
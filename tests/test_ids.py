@@ -0,0 +1,60 @@
+"""
+Tests for the ID pool.
+
+Tests ID generation including:
+- ID format
+- Uniqueness across refills
+- Fresh IDs in forked children
+"""
+
+import os
+import re
+
+import pytest
+
+from atlas.ids import IdPool, next_id
+
+
+class TestIdPool:
+    """Test IdPool ID generation."""
+
+    def test_id_format(self):
+        """Test IDs are prefix plus hex of the requested length."""
+        pool = IdPool()
+
+        assert re.fullmatch(r"sess-[0-9a-f]{12}", pool.next_id("sess"))
+        assert re.fullmatch(r"fs-[0-9a-f]{16}", pool.next_id("fs", nbytes=8))
+        assert re.fullmatch(r"session-[0-9a-f]{12}", next_id("session"))
+
+    def test_ids_unique_across_refills(self):
+        """Test a small pool keeps producing distinct IDs after refilling."""
+        pool = IdPool(size=64)
+
+        ids = {pool.next_id("x") for _ in range(1000)}
+
+        assert len(ids) == 1000
+
+    def test_id_larger_than_pool(self):
+        """Test an ID wider than the pool size still gets enough bytes."""
+        pool = IdPool(size=4)
+
+        assert len(pool.next_id("x", nbytes=8)) == len("x-") + 16
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_forked_child_draws_fresh_ids(self):
+        """Test a forked child does not repeat the parent's next IDs."""
+        next_id("evt")  # make sure the parent holds a block
+        read_end, write_end = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.write(write_end, next_id("evt").encode())
+            os._exit(0)
+
+        os.close(write_end)
+        child_id = os.read(read_end, 64).decode()
+        os.close(read_end)
+        os.waitpid(pid, 0)
+
+        assert child_id != next_id("evt")
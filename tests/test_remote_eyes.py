@@ -0,0 +1,370 @@
+"""
+Tests for the remote Eyes.
+
+Tests RemoteRepoEye and WebEye against a local HTTP server including:
+- Event emission for fetched URLs
+- Concurrent repository fetches in candidate order
+- Policy limits and missing files
+- Keep-alive connection reuse
+"""
+
+import hashlib
+import io
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib.error import HTTPError, URLError
+
+from atlas.eyes.common import READ_CHUNK_SIZE, collapse_whitespace, read_body
+from atlas.eyes.remote_repo import RemoteRepoEye
+from atlas.eyes.web import WebEye
+from atlas.ledger.writer import EventWriter
+from atlas.remote.connections import ConnectionPool
+from atlas.remote.policy import RemotePolicy
+
+# Every request to the local server takes at least this long.
+DELAY = 0.2
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves /missing as 404, /moved as a redirect, others by name."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/target")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"content of {self.path}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SimpleBudget:
+    """Simple remote budget object for testing."""
+
+    def __init__(self, max_time_ms=None, max_bytes=None):
+        self.max_time_ms = max_time_ms
+        self.max_bytes = max_bytes
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a local HTTP server for the module's tests."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Create event writer for testing."""
+    return EventWriter(ledger_dir=str(tmp_path / "ledger"))
+
+
+def read_events(writer):
+    """Return the ledger's events in order."""
+    lines = next(writer.ledger_dir.glob("*.jsonl")).read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestRemoteRepoEye:
+    """Test RemoteRepoEye repository observation."""
+
+    def observe_repo(self, writer, urls, policy, **kwargs):
+        eye = RemoteRepoEye(writer)
+        eye.enumerate = lambda repo_url: urls
+        return eye.observe_repo(
+            repo_url="https://github.com/owner/repo",
+            budget=SimpleBudget(),
+            remote_policy=policy,
+            **kwargs,
+        )
+
+    def test_fetches_concurrently_in_order(self, server, writer):
+        """Test candidates overlap in time but report in order."""
+        urls = [f"{server}/file{i}" for i in range(6)]
+
+        start = time.monotonic()
+        results = self.observe_repo(writer, urls, RemotePolicy.permissive())
+        elapsed = time.monotonic() - start
+
+        assert elapsed < DELAY * len(urls) / 2
+        assert [r["url"] for r in results] == urls
+        assert all(r["status"] == "success" for r in results)
+        seen = [
+            e["payload"]["locator"] for e in read_events(writer)
+            if e["event_type"] == "ARTIFACT_SEEN"
+        ]
+        assert seen == urls
+
+    def test_matches_serial_run(self, server, tmp_path):
+        """Test concurrent and serial runs give the same results."""
+        urls = [f"{server}/a", f"{server}/missing", f"{server}/b"]
+
+        def run(workers):
+            writer = EventWriter(ledger_dir=str(tmp_path / f"ledger{workers}"))
+            results = self.observe_repo(
+                writer, urls, RemotePolicy.permissive(), workers=workers,
+            )
+            types = [e["event_type"] for e in read_events(writer)]
+            return results, types
+
+        assert run(8) == run(1)
+
+    def test_call_limit_stops_admission(self, server, writer):
+        """Test candidates past the call limit are not fetched."""
+        urls = [f"{server}/file{i}" for i in range(5)]
+        policy = RemotePolicy.permissive(max_calls=2)
+
+        results = self.observe_repo(writer, urls, policy)
+
+        assert [r["url"] for r in results] == urls[:2]
+        assert policy.calls_made == 2
+
+    def test_declined_urls_keep_their_place(self, server, writer):
+        """Test policy refusals are reported in candidate order."""
+        urls = [f"{server}/a", "https://example.com/b", f"{server}/c"]
+        policy = RemotePolicy.permissive(domains=["127.0.0.1"])
+
+        results = self.observe_repo(writer, urls, policy)
+
+        assert [r["status"] for r in results] == [
+            "success", "declined", "success",
+        ]
+        types = [e["event_type"] for e in read_events(writer)]
+        assert types[3] == "REMOTE_LOOKUP_DECLINED"
+        assert policy.calls_made == 2
+
+    def test_can_handle(self, writer):
+        """Test locator prefixes match regardless of case."""
+        eye = RemoteRepoEye(writer)
+
+        assert eye.can_handle("HTTPS://GitHub.com/owner/repo")
+        assert eye.can_handle("git+https://github.com/owner/repo")
+        assert not eye.can_handle("https://example.com/owner/repo")
+        assert WebEye(writer).can_handle("HTTP://example.com/" + "x" * 500)
+        assert not WebEye(writer).can_handle("ftp://example.com/")
+
+    def test_parse_github_url(self, writer):
+        """Test owner and repo are parsed from supported locators."""
+        eye = RemoteRepoEye(writer)
+
+        assert eye._parse_github_url(
+            "git+https://github.com/owner/repo.git"
+        ) == ("owner", "repo")
+        assert eye._parse_github_url(
+            "https://github.com/owner/repo/tree/main"
+        ) == ("owner", "repo")
+        assert eye._parse_github_url("https://example.com/owner/repo") is None
+
+    def test_hash_algorithm_option(self, server, writer):
+        """Test fingerprints use the configured algorithm."""
+        eye = RemoteRepoEye(writer, hash_algorithm="blake2b")
+        eye.enumerate = lambda repo_url: [f"{server}/a"]
+
+        eye.observe_repo(
+            repo_url="https://github.com/owner/repo",
+            budget=SimpleBudget(),
+            remote_policy=RemotePolicy.permissive(),
+        )
+
+        (fingerprint,) = [
+            e["payload"] for e in read_events(writer)
+            if e["event_type"] == "FINGERPRINT_COMPUTED"
+        ]
+        assert fingerprint["hash_algorithm"] == "blake2b"
+        assert fingerprint["content_hash"] == hashlib.blake2b(
+            b"content of /a"
+        ).hexdigest()
+
+    @pytest.mark.parametrize("algorithm", ["nope", "shake_128"])
+    def test_unusable_hash_algorithm_rejected(self, writer, algorithm):
+        """Test unknown or variable-length algorithms fail at construction."""
+        with pytest.raises(ValueError):
+            RemoteRepoEye(writer, hash_algorithm=algorithm)
+        with pytest.raises(ValueError):
+            WebEye(writer, hash_algorithm=algorithm)
+
+
+class TestConnectionPool:
+    """Test keep-alive connection reuse."""
+
+    def test_reuses_connection(self, server):
+        """Test sequential fetches share one connection."""
+        pool = ConnectionPool()
+        before = _Handler.connections
+
+        for i in range(3):
+            with pool.open(f"{server}/file{i}", {}, timeout=5) as response:
+                assert response.read() == f"content of /file{i}".encode()
+
+        assert _Handler.connections - before == 1
+        pool.close()
+
+    def test_follows_redirects(self, server):
+        """Test redirects are followed on the pooled connection."""
+        pool = ConnectionPool()
+
+        with pool.open(f"{server}/moved", {}, timeout=5) as response:
+            assert response.read() == b"content of /target"
+        pool.close()
+
+    def test_error_status_raises_http_error(self, server):
+        """Test error statuses raise HTTPError, as urlopen does."""
+        pool = ConnectionPool()
+
+        with pytest.raises(HTTPError) as excinfo:
+            with pool.open(f"{server}/missing", {}, timeout=5):
+                pass
+
+        assert excinfo.value.code == 404
+
+    def test_refused_connection_keeps_reason(self):
+        """Test a refused connect reports the original error."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(URLError) as excinfo:
+            with ConnectionPool().open(f"http://127.0.0.1:{port}/", {}, 5):
+                pass
+
+        assert isinstance(excinfo.value.reason, ConnectionRefusedError)
+
+    def test_web_eye_reuses_connection(self, server, writer):
+        """Test WebEye keeps its connection across observations."""
+        eye = WebEye(writer)
+        policy = RemotePolicy.permissive()
+        before = _Handler.connections
+
+        results = [
+            eye.observe(f"{server}/page{i}", SimpleBudget(), policy)
+            for i in range(3)
+        ]
+
+        assert all(r["status"] == "success" for r in results)
+        assert _Handler.connections - before == 1
+
+
+class TestWebEye:
+    """Test WebEye single-URL observation."""
+
+    def test_default_fingerprint_is_sha256(self, server, writer):
+        """Test the default fingerprint matches hashlib.sha256."""
+        result = WebEye(writer).observe(
+            f"{server}/page", SimpleBudget(), RemotePolicy.permissive(),
+        )
+
+        (fingerprint,) = [
+            e["payload"] for e in read_events(writer)
+            if e["event_type"] == "FINGERPRINT_COMPUTED"
+        ]
+        digest = hashlib.sha256(b"content of /page").hexdigest()
+        assert fingerprint["hash_algorithm"] == "sha256"
+        assert fingerprint["content_hash"] == digest
+        assert result["artifact_id"] == digest
+
+
+class TestReadBody:
+    """Test single-pass body reading."""
+
+    def test_matches_whole_body(self):
+        """Test chunked hashing and decoding match the whole body."""
+        # A multi-byte character straddles the first chunk boundary
+        data = b" " * (READ_CHUNK_SIZE - 1) + "\u20ac word\n".encode() * 40
+
+        body = read_body(io.BytesIO(data), 1_000_000, hashlib.sha256())
+
+        assert body.size == len(data)
+        assert body.content_hash == hashlib.sha256(data).hexdigest()
+        assert body.excerpt == " ".join(data.decode().split())
+
+    def test_short_reads(self):
+        """Test partial readinto results are stitched together."""
+
+        class Trickle(io.BytesIO):
+            def readinto(self, buffer):
+                return super().readinto(buffer[:1000])
+
+        data = "caf\u00e9 ".encode() * 5000
+
+        body = read_body(Trickle(data), 1_000_000, hashlib.sha256())
+
+        assert body.size == len(data)
+        assert body.content_hash == hashlib.sha256(data).hexdigest()
+        assert body.excerpt.startswith("caf\u00e9 caf\u00e9")
+
+    def test_collapse_whitespace(self):
+        """Test collapsing matches str.split, reading only what it needs."""
+        short = " a\t b\n\u00a0c "
+        long_text = "word \n " * 10_000
+        sparse = " " * 10_000 + "tail"
+
+        assert collapse_whitespace(short, 500) == "a b c"
+        collapsed = collapse_whitespace(long_text, 500)
+        assert 500 <= len(collapsed) < len(long_text) // 2
+        assert " ".join(long_text.split()).startswith(collapsed)
+        assert collapse_whitespace(sparse, 500) == "tail"
+
+    def test_limits_bytes_and_excerpt(self):
+        """Test max_bytes bounds the read and long excerpts are cut."""
+        data = b"word " * 1000
+
+        body = read_body(io.BytesIO(data), 3000, hashlib.sha256())
+
+        assert body.size == 3000
+        assert body.content_hash == hashlib.sha256(data[:3000]).hexdigest()
+        assert len(body.excerpt) == 500
+        assert body.excerpt.endswith("...")
+
+    def test_observation_events_share_timestamp(self, server, writer):
+        """Test one observation's events carry a single timestamp."""
+        WebEye(writer).observe(
+            f"{server}/page", SimpleBudget(), RemotePolicy.permissive(),
+        )
+
+        events = read_events(writer)
+        assert len(events) == 3
+        assert len({e["ts"] for e in events}) == 1
+        assert all(e["actor"] == {"module": "WebEye"} for e in events)
+
+    def test_observation_written_in_one_batch(self, server, writer):
+        """Test a successful observation reaches the ledger in one write."""
+        writes = []
+        writer.append = lambda event: writes.append([event])
+        writer.append_many = lambda events: writes.append(list(events))
+
+        WebEye(writer).observe(
+            f"{server}/page", SimpleBudget(), RemotePolicy.permissive(),
+        )
+
+        assert [[e["event_type"] for e in batch] for batch in writes] == [[
+            "ARTIFACT_SEEN", "FINGERPRINT_COMPUTED", "EXTRACTION_PERFORMED",
+        ]]
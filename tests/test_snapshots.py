@@ -0,0 +1,72 @@
+"""
+Tests for state snapshots.
+
+Tests snapshot I/O including:
+- Write/read roundtrip
+- Skipping malformed lines
+- Cached reads keyed on file mtime and size
+"""
+
+import os
+
+from atlas.state import snapshots
+from atlas.state.snapshots import (
+    get_snapshot,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+
+
+class TestSnapshots:
+    """Test snapshot reading and writing."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test artifacts survive a write/read cycle."""
+        artifacts = {
+            "a1": {"artifact_id": "a1", "locator": "/tmp/ü.txt"},
+            "a2": {"artifact_id": "a2", "locator": "/tmp/b.txt"},
+        }
+        path = snapshot_path(tmp_path)
+
+        assert write_snapshot(path, artifacts) == 2
+        assert read_snapshot(path) == artifacts
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        """Test unreadable lines are ignored."""
+        path = tmp_path / "s.snapshot.jsonl"
+        path.write_text(
+            '{"artifact_id": "a1"}\n\nnot json\n{"locator": "x"}\n'
+        )
+
+        assert read_snapshot(path) == {"a1": {"artifact_id": "a1"}}
+
+    def test_get_snapshot_missing(self, tmp_path):
+        """Test a missing snapshot returns None."""
+        assert get_snapshot(tmp_path / "missing.jsonl") is None
+
+    def test_get_snapshot_reuses_unchanged_file(self, tmp_path, monkeypatch):
+        """Test get_snapshot parses again only after the file changes."""
+        path = snapshot_path(tmp_path)
+        write_snapshot(path, {"a1": {"artifact_id": "a1"}})
+
+        reads = []
+        real_read = snapshots.read_snapshot
+
+        def counting_read(p):
+            reads.append(p)
+            return real_read(p)
+
+        monkeypatch.setattr(snapshots, "read_snapshot", counting_read)
+
+        first = get_snapshot(path)
+        first["a9"] = {}
+        assert get_snapshot(path) == {"a1": {"artifact_id": "a1"}}
+        assert len(reads) == 1
+
+        write_snapshot(path, {"a2": {"artifact_id": "a2"}})
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert get_snapshot(path) == {"a2": {"artifact_id": "a2"}}
+        assert len(reads) == 2
@@ -12,6 +12,7 @@ import time
 
 import pytest
 
+from atlas.ledger.reader import EventReader
 from atlas.ledger.writer import EventWriter
 
 
@@ -164,3 +165,116 @@ class TestEventWriter:
         content = files[0].read_text()
         lines = [line for line in content.strip().split("\n") if line]
         assert len(lines) == 3
+
+    def test_append_many_writes_all_events(self, tmp_path):
+        """Test append_many writes every event in order."""
+        writer = EventWriter(ledger_dir=str(tmp_path))
+
+        events = [
+            {
+                "event_id": f"test-{i:03d}",
+                "event_type": "ARTIFACT_SEEN",
+                "ts": time.time(),
+                "actor": {"module": "test"},
+                "payload": {},
+            }
+            for i in range(3)
+        ]
+
+        assert writer.append_many(events) == 3
+        assert writer.append_many([]) == 0
+
+        files = list(tmp_path.glob("*.jsonl"))
+        lines = files[0].read_text().strip().split("\n")
+        assert [json.loads(line)["event_id"] for line in lines] == [
+            "test-000", "test-001", "test-002",
+        ]
+
+    def test_append_many_rejects_batch_atomically(self, tmp_path):
+        """Test an invalid event keeps the whole batch out of the ledger."""
+        writer = EventWriter(ledger_dir=str(tmp_path))
+
+        events = [
+            {"event_id": "test-001", "event_type": "ARTIFACT_SEEN"},
+            {"event_type": "ARTIFACT_SEEN"},
+        ]
+
+        with pytest.raises(ValueError):
+            writer.append_many(events)
+
+        assert list(tmp_path.glob("*.jsonl")) == []
+
+    def test_append_lines(self, tmp_path):
+        """Test pre-serialized lines are written as given."""
+        writer = EventWriter(ledger_dir=str(tmp_path))
+        lines = [
+            '{"event_id": "test-001", "event_type": "ARTIFACT_SEEN"}\n',
+            '{"event_id": "test-002", "event_type": "ARTIFACT_SEEN"}\n',
+        ]
+
+        assert writer.append_lines(lines) == 2
+        assert writer.append_lines([]) == 0
+
+        files = list(tmp_path.glob("*.jsonl"))
+        assert files[0].read_text() == "".join(lines)
+
+    def test_append_lines_refused_when_strict(self, tmp_path):
+        """Test strict writers refuse unvalidated lines."""
+        writer = EventWriter(ledger_dir=str(tmp_path), strict=True)
+
+        with pytest.raises(ValueError):
+            writer.append_lines(['{"event_id": "x", "event_type": "y"}\n'])
+
+        assert list(tmp_path.glob("*.jsonl")) == []
+
+    def test_commit_group_defers_writes(self, tmp_path):
+        """Test commit_group holds events until the group is flushed."""
+        writer = EventWriter(ledger_dir=str(tmp_path))
+
+        def event(i):
+            return {"event_id": f"test-{i:03d}", "event_type": "ARTIFACT_SEEN"}
+
+        def written():
+            return sum(
+                len(path.read_text().splitlines())
+                for path in tmp_path.glob("*.jsonl")
+            )
+
+        with writer.commit_group(max_events=3, max_delay_ms=60_000):
+            writer.append(event(0))
+            writer.append(event(1))
+            assert written() == 0
+
+            writer.append_many([event(2), event(3)])
+            assert written() == 4
+
+            writer.append(event(4))
+            assert written() == 4
+
+        assert written() == 5
+
+        with pytest.raises(RuntimeError):
+            with writer.commit_group():
+                with writer.commit_group():
+                    pass
+
+
+class TestEventReader:
+    """Test EventReader against files written by EventWriter."""
+
+    def test_read_all_roundtrip(self, tmp_path):
+        """Test events read back in order, skipping blank lines."""
+        writer = EventWriter(ledger_dir=str(tmp_path))
+        writer.append_many([
+            {"event_id": "test-001", "event_type": "ARTIFACT_SEEN"},
+            {"event_id": "test-002", "event_type": "ARTIFACT_SEEN"},
+        ])
+        with open(next(tmp_path.glob("*.jsonl")), "a") as f:
+            f.write("\n")
+
+        reader = EventReader(ledger_dir=str(tmp_path))
+
+        assert len(list(reader.read_lines())) == 2
+        assert [e["event_id"] for e in reader.read_all()] == [
+            "test-001", "test-002",
+        ]